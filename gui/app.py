@@ -47,17 +47,22 @@ animate_checkbox = Checkbox(x=950, y=350, label="Animate Generation")
 width_box = TextBox(x=950, y=420, label="Width:")
 height_box = TextBox(x=1030, y=420, label="Height:")
 
-class LightweightMaze:
-    def __init__(self, grid, start=None, goal=None):
-        self.maze = grid
-        self.start = start
-        self.goal = goal
-
-def animate_generation(renderer, maze, delay=0.01):
-    for i, frame in enumerate(maze.history):
-        print(f"[DEBUG] Frame {i} type: {type(frame)}, shape: {getattr(frame, 'shape', None)}")
-        renderer.draw_maze(LightweightMaze(frame))
+def animate_generation(renderer, maze, algorithm, delay=0.01):
+    """Draw the maze as it is carved, one streamed step at a time."""
+    renderer.load_maze(maze)
+    if algorithm == "recdiv":
+        renderer.clear()  # Recursive division adds walls to an open field
+    else:
+        renderer.draw_maze(maze)  # Solid walls to carve into
+    steps = maze.iter_generate(algorithm)
+    for gy, gx, wy, wx in steps:
+        for y, x in ((gy, gx), (wy, wx)):
+            renderer.draw_cell(x, y, (255, 255, 255) if maze.maze[y, x] else (0, 0, 0))
         renderer.update(delay)
+        if not renderer.running:
+            break
+    for _ in steps:  # Window closed: finish the maze without drawing
+        pass
 
 
 # --- Generate Maze Logic ---
@@ -107,14 +112,12 @@ def generate_maze_callback():
     renderer._update_dimensions()  # Ensure dimensions are recalculated
 
     maze = Maze(width, height)
-    maze.generate(algo_key_map[selected_algo], animate=animate)
-    print(f"[DEBUG] Maze generated, shape: {maze.maze.shape}")
-    print(f"[DEBUG] Maze data sample: {maze.maze[0, :10]}")  # Check maze content
     if animate:
-        print("[DEBUG] Starting animation with", len(maze.history), "frames")
-        animate_generation(renderer, maze)
+        animate_generation(renderer, maze, algo_key_map[selected_algo])
     else:
+        maze.generate(algo_key_map[selected_algo])
         renderer.load_maze(maze)  # Immediate display if not animating
+    print(f"[DEBUG] Maze generated, shape: {maze.maze.shape}")
 
     current_maze = maze
     renderer.load_maze(maze)  # Finalize entry/goal, grid resizing
@@ -11,6 +11,7 @@ import maze_generators.wilsons as wilsons
 import maze_generators.recdiv as recdiv
 import maze_generators.handk as handk
 import maze_generators.kruskals as kruskals
+import maze_generators.eller as eller
 # Solver imports
 from solvers.a_star import solve as a_star_solver
 from solvers.dijkstra import solve as dijkstra_solver
@@ -18,6 +19,10 @@ from solvers.bfs import solve as bfs_solver
 from solvers.greedy import solve as greedy_solver
 from solvers.dfs import solve as dfs_solver
 from solvers.bidirectional import solve as bidirectional_solver
+from solvers.wavefront import solve as wavefront_solver
+from solvers.tree_lca import solve as tree_lca_solver
+from solvers.hpa import solve as hpa_solver
+from solvers.incremental import solve as lpa_solver
 
 algorithms = {
     1: dfs.generate_maze,
@@ -25,7 +30,8 @@ algorithms = {
     3: wilsons.generate_maze,
     4: recdiv.generate_maze,
     5: handk.generate_maze,
-    6: kruskals.generate_maze
+    6: kruskals.generate_maze,
+    7: eller.generate_maze
 }
 
 algo_names = {
@@ -34,7 +40,18 @@ algo_names = {
     3: "Wilson's Algorithm",
     4: "Recursive Division",
     5: "Hunt and Kill",
-    6: "Kruskal's Algorithm"
+    6: "Kruskal's Algorithm",
+    7: "Eller's Algorithm"
+}
+
+algo_keys = {
+    1: "dfs",
+    2: "prims",
+    3: "wilsons",
+    4: "recdiv",
+    5: "handk",
+    6: "kruskals",
+    7: "eller"
 }
 
 solvers = {
@@ -44,6 +61,10 @@ solvers = {
     4: greedy_solver,
     5: dfs_solver,
     6: bidirectional_solver,
+    7: wavefront_solver,
+    8: tree_lca_solver,
+    9: hpa_solver,
+    10: lpa_solver,
 }
 
 solver_names = {
@@ -53,20 +74,24 @@ solver_names = {
     4: "Greedy Best-First Search",
     5: "Depth-First Search",
     6: "Bidirectional_solver",
+    7: "Wavefront BFS",
+    8: "Tree LCA",
+    9: "HPA*",
+    10: "LPA*",
 }
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Maze Generator Visualizer")
-    parser.add_argument('--algo', type=int, choices=range(1, 7), default=1,
-                        help="Choose maze generation algorithm (1=DFS Backtracker, 2=Prim's, 3=Wilson's, 4=Recursive Division, 5=Hunt & Kill, 6=Kruskal's)")
+    parser.add_argument('--algo', type=int, choices=range(1, 8), default=1,
+                        help="Choose maze generation algorithm (1=DFS Backtracker, 2=Prim's, 3=Wilson's, 4=Recursive Division, 5=Hunt & Kill, 6=Kruskal's, 7=Eller's)")
     parser.add_argument('--width', type=int, default=None,
                         help="Maze width in cells")
     parser.add_argument('--height', type=int, default=None,
                         help="Maze height in cells")
     parser.add_argument('--size', type=int, default=50,
                         help="Maze width and height for square mazes (overrides width/height)")
-    parser.add_argument('--solve', type=int, choices=range(1, 7), default=0,
-                        help="Choose maze solving algorithm (1=A*, 2=Dijkstra, 3=BFS, 4=Greedy, 5=DFS, 6=Bidirectional)")
+    parser.add_argument('--solve', type=int, choices=range(1, 11), default=0,
+                        help="Choose maze solving algorithm (1=A*, 2=Dijkstra, 3=BFS, 4=Greedy, 5=DFS, 6=Bidirectional, 7=Wavefront BFS, 8=Tree LCA, 9=HPA*, 10=LPA*)")
     parser.add_argument('--animate', action='store_true',
                         help="Enable animation for maze generation")
     parser.add_argument('--animate-solve', action='store_true',
@@ -81,9 +106,12 @@ if __name__ == "__main__":
     maze_width = args.width if args.width is not None else args.size
     maze_height = args.height if args.height is not None else args.size
     print(f"Generating maze using {algo_name} (size {maze_width}x{maze_height})...")
-    # Generate maze without renderer first
-    maze, start, goal = algo_fn(maze_width, maze_height, render=None, animate=args.animate)
-    print(f"Debug: Raw history={maze.history[:20]}...")  # Check first 20 steps
+    if args.animate:
+        # Stream carving steps straight to the screen while the maze is generated
+        maze = Maze(maze_width, maze_height)
+        start, goal = maze.start, maze.goal
+    else:
+        maze, start, goal = algo_fn(maze_width, maze_height, render=None, animate=False)
 
     # Initialize renderer with maze size, white canvas
     renderer = PygameRenderer(2 * maze_width + 1, 2 * maze_height + 1)  # Match maze dimensions
@@ -97,20 +125,22 @@ if __name__ == "__main__":
     renderer.mark_cell((maze.goal[0], maze.goal[1]), (0, 255, 0))
     renderer.update()
 
-    print(f"Debug: animate={args.animate}, history length={len(maze.history)}")  # Check before conditional
-    if args.animate and maze.history:
-        print(f"Starting animation of {len(maze.history)} steps")
+    if args.animate:
+        print(f"Streaming {algo_name} generation")
         renderer.set_maze(maze)  # Set maze for reference
+        steps = maze.iter_generate(algo_keys[args.algo])
         step_count = 0
-        for step in maze.get_animation_steps():
+        for step in steps:
             step_count += 1
             if step_count % 60 == 0:  # Print every 60 steps
-                print(f"Processing step {step_count}/{len(maze.history)}: {step}")
+                print(f"Processing step {step_count}: {step}")
             renderer.draw_step(step)  # Draw on white
             renderer.update(delay=0.05)
             pygame.event.pump()  # Force event processing
             if not renderer.running:
                 break
+        for _ in steps:  # Window closed early: finish generating without drawing
+            pass
         print(f"Animation complete: {step_count} steps processed")
     
     renderer.draw_maze(maze)  # Draw final maze
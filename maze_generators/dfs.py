@@ -1,9 +1,11 @@
 # maze_generators/dfs.py
-from models.maze import Maze
+from models.maze import Maze, DEFAULT_MAX_CELLS
 
-def generate_maze(width: int, height: int, entry=(0, 0), goal=None, render=None, animate=False):
+def generate_maze(width: int, height: int, entry=(0, 0), goal=None, render=None, animate=False,
+                  max_cells=DEFAULT_MAX_CELLS, backing_file=None, seed=None):
     """Return a Maze filled with dfs algorithm paths."""
-    maze = Maze(width, height, entry, goal)
+    maze = Maze(width, height, entry, goal, max_cells=max_cells,
+                backing_file=backing_file, seed=seed)
     maze.generate("dfs", animate=animate)  # Use the animate parameter
     if render:
         render.draw_maze(maze, entry=maze.start, goal=maze.goal)
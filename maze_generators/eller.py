@@ -0,0 +1,24 @@
+# maze_generators/eller.py
+from typing import Iterator
+
+import numpy as np
+from models.maze import Maze, DEFAULT_MAX_CELLS, eller_rows
+
+
+def generate_maze(width: int, height: int,
+                  entry=(0, 0), goal=None,
+                  render=None, animate: bool = False,
+                  max_cells=DEFAULT_MAX_CELLS, backing_file=None, seed=None):
+    """Return a Maze filled with Eller's algorithm paths."""
+    maze = Maze(width, height, entry, goal, max_cells=max_cells,
+                backing_file=backing_file, seed=seed)
+    maze.generate("eller", animate=animate)    # calls Maze._eller_generate
+    if render:
+        render.draw_maze(maze, entry=maze.start, goal=maze.goal)
+        render.update()
+    return maze, maze.start, maze.goal
+
+
+def stream_rows(width: int, height: int, seed=None) -> Iterator[np.ndarray]:
+    """Yield the grid rows of an Eller's maze one at a time (O(width) memory)."""
+    return eller_rows(width, height, seed)
@@ -1,11 +1,13 @@
 # maze_generators/handk.py
-from models.maze import Maze
+from models.maze import Maze, DEFAULT_MAX_CELLS
 
 def generate_maze(width: int, height: int,
                   entry=(0, 0), goal=None,
-                  render=None, animate: bool = False):
+                  render=None, animate: bool = False,
+                  max_cells=DEFAULT_MAX_CELLS, backing_file=None, seed=None):
     """Hunt-and-Kill wrapper that returns a Maze object."""
-    maze = Maze(width, height, entry, goal)
+    maze = Maze(width, height, entry, goal, max_cells=max_cells,
+                backing_file=backing_file, seed=seed)
     maze.generate("handk", animate=animate)          # <- calls Maze._handk_generate
     if render:
         render.draw_maze(maze, entry=maze.start, goal=maze.goal)
@@ -1,11 +1,13 @@
 # maze_generators/kruskals.py
-from models.maze import Maze
+from models.maze import Maze, DEFAULT_MAX_CELLS
 
 def generate_maze(width:int, height:int,
                   entry=(0,0), goal=None,
-                  render=None, animate:bool=False):
+                  render=None, animate:bool=False,
+                  max_cells=DEFAULT_MAX_CELLS, backing_file=None, seed=None):
     """Return a Maze filled with Kruskal’s algorithm paths."""
-    m = Maze(width, height, entry, goal)
+    m = Maze(width, height, entry, goal, max_cells=max_cells,
+             backing_file=backing_file, seed=seed)
     m.generate("kruskals", animate=animate)
     if render:
         render.draw_maze(m, entry=m.start, goal=m.goal)
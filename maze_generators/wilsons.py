@@ -1,10 +1,11 @@
 # maze_generators/wilsons.py
-from models.maze import Maze
+from models.maze import Maze, DEFAULT_MAX_CELLS
 
 def generate_maze(width, height, entry=(0,0), goal=None,
-                  render=None, animate=False):
+                  render=None, animate=False, max_cells=DEFAULT_MAX_CELLS, backing_file=None, seed=None):
     """Return a Maze filled with Wilson’s algorithm paths."""
-    maze = Maze(width, height, entry, goal)
+    maze = Maze(width, height, entry, goal, max_cells=max_cells,
+                backing_file=backing_file, seed=seed)
     maze.generate("wilsons", animate=animate)
     if render:
         render.draw_maze(maze, entry=maze.start, goal=maze.goal)
@@ -0,0 +1,61 @@
+# mazegen/batch.py
+
+import os
+import random
+from multiprocessing import Pool
+from typing import Iterator, Optional
+
+import numpy as np
+from mazegen.interface import GENERATOR_MAP, generate_maze
+from models.maze import DEFAULT_MAX_CELLS
+
+
+def item_seed(base_seed: int, index: int) -> int:
+    """Seed of item *index* in a batch, so any single item can be regenerated
+    on its own with generate_maze(algo, size, height, seed=item_seed(...))."""
+    return base_seed + index
+
+
+def _generate_item(job: tuple) -> tuple:
+    """Pool worker: generate one batch item (top-level so it pickles)."""
+    index, algo, size, height, max_cells, seed = job
+    grid, start, goal = generate_maze(algo, size, height=height, max_cells=max_cells, seed=seed)
+    return index, seed, grid, start, goal
+
+
+def generate_batch(algo: str, count: int, size: int = 21, height: Optional[int] = None,
+                   seed: Optional[int] = None, jobs: Optional[int] = None, ordered: bool = True,
+                   max_cells: Optional[int] = DEFAULT_MAX_CELLS, chunksize: Optional[int] = None
+                   ) -> Iterator[tuple[int, int, np.ndarray, tuple[int, int], tuple[int, int]]]:
+    """Generate *count* mazes across *jobs* worker processes.
+
+    Yields (index, seed, grid, start, goal) per maze. Item *index* is seeded
+    with item_seed(seed, index), so a batch is reproducible whatever the job
+    count; with seed=None a random base seed is drawn. Results come back in
+    index order, or as soon as each finishes when *ordered* is False.
+
+    *jobs* defaults to os.cpu_count(); jobs=1 runs in-process with no pool.
+    Items are sent to workers *chunksize* at a time, which amortizes the
+    per-task IPC that would otherwise dominate for small mazes.
+    """
+    if algo not in GENERATOR_MAP:
+        raise ValueError(f"Unknown algorithm '{algo}'. Valid options: {list(GENERATOR_MAP.keys())}")
+    if count < 0:
+        raise ValueError("count must be non-negative.")
+    if seed is None:
+        seed = random.SystemRandom().randrange(1 << 32)
+    jobs = max(1, min(jobs or os.cpu_count() or 1, count or 1))
+    work = ((i, algo, size, height, max_cells, item_seed(seed, i)) for i in range(count))
+
+    if jobs == 1:
+        for job in work:
+            yield _generate_item(job)
+        return
+
+    if chunksize is None:
+        chunksize = max(1, min(256, count // (4 * jobs)))
+    with Pool(jobs) as pool:
+        results = pool.imap(_generate_item, work, chunksize) if ordered \
+            else pool.imap_unordered(_generate_item, work, chunksize)
+        yield from results
+
@@ -1,11 +1,19 @@
 # mazegen/cli.py
 
 import os
+import random
+import sys
+import time
 from datetime import datetime
 import argparse
 import json
 import numpy as np
+from mazegen.batch import generate_batch
 from mazegen.interface import generate_maze
+from mazegen.tiled import generate_tiled
+from maze_generators import eller
+from models.maze import DEFAULT_MAX_CELLS
+from models.packed import PackedGrid
 
 def ascii_render(maze, style="blocks"):
     themes = {
@@ -17,59 +25,195 @@ def ascii_render(maze, style="blocks"):
     chars = themes.get(style, themes["blocks"])
     return "\n".join("".join(chars[cell] for cell in row) for row in maze)
 
-def main():
-    parser = argparse.ArgumentParser(description="Maze generator CLI")
-    parser.add_argument("--algo", type=str, required=True, help="Algorithm to use (e.g., dfs, prims)")
-    parser.add_argument("--size", type=int, default=21, help="Size of the maze (must be odd)")
-    parser.add_argument("--format", type=str, default="json", choices=["json", "ascii", "npy"], help="Output format")
-    parser.add_argument("--output", type=str, default=None, help="Output file (default: stdout)")
-    parser.add_argument("--style", type=str, default="blocks", choices=["blocks", "dots", "unicode", "roguelike"], help="ASCII style")
-    parser.add_argument("--save-meta", action="store_true", help="Save metadata about the maze generation")
-
-
-    args = parser.parse_args()
-    maze, start, goal = generate_maze(args.algo, args.size)
-
-    if args.format == "json":
+def write_maze(maze, start, goal, fmt, style="blocks", output=None, verbose=True):
+    """Write a fully generated grid in the requested format (*verbose* reports saved files)."""
+    if fmt == "json":
         result = {
             "maze": maze.tolist(),
             "start": start,
             "goal": goal
         }
-        output = json.dumps(result, indent=2)
-        if args.output:
-            with open(args.output, "w") as f:
-                f.write(output)
+        text = json.dumps(result, indent=2)
+        if output:
+            with open(output, "w") as f:
+                f.write(text)
         else:
-            print(output)
+            print(text)
 
-    elif args.format == "ascii":
-        output = ascii_render(maze, style=args.style)
-        if args.output:
-            with open(args.output, "w") as f:
-                f.write(output)
+    elif fmt == "ascii":
+        text = ascii_render(maze, style=style)
+        if output:
+            with open(output, "w") as f:
+                f.write(text)
         else:
-            print(output)        
+            print(text)
 
-    elif args.format == "npy":
-        if not args.output:
+    elif fmt == "npy":
+        if not output:
             raise ValueError("Output file required for .npy format")
 
-        # Save maze to .npy
-        np.save(args.output, maze)
+        # Save maze to .npy; a grid generated straight into this file just needs flushing
+        if isinstance(maze, np.memmap) and os.path.abspath(maze.filename) == os.path.abspath(output):
+            maze.flush()
+        else:
+            np.save(output, maze)
 
         # Also save start and goal as JSON sidecar
-        meta_path = args.output.rsplit(".", 1)[0] + "_meta.json"
+        meta_path = output.rsplit(".", 1)[0] + "_meta.json"
+        with open(meta_path, "w") as f:
+            json.dump({"start": start, "goal": goal}, f)
+
+        if verbose:
+            print(f"Saved .npy to {output}")
+            print(f"Saved metadata to {meta_path}")
+
+    elif fmt == "packed":
+        if not output:
+            raise ValueError("Output file required for packed format")
+
+        # Two wall bits per cell, 16x smaller than .npy
+        PackedGrid.from_grid(maze).save(output)
+        meta_path = output.rsplit(".", 1)[0] + "_meta.json"
         with open(meta_path, "w") as f:
             json.dump({"start": start, "goal": goal}, f)
 
-        print(f"Saved .npy to {args.output}")
+        if verbose:
+            print(f"Saved packed maze to {output}")
+            print(f"Saved metadata to {meta_path}")
+
+def stream_maze(rows, shape, start, goal, fmt, style="blocks", output=None):
+    """Write grid *rows* as they are produced, so only one row is ever in memory."""
+    if fmt == "npy":
+        if not output:
+            raise ValueError("Output file required for .npy format")
+        with open(output, "wb") as f:
+            np.lib.format.write_array_header_1_0(f, {"descr": np.lib.format.dtype_to_descr(np.dtype(np.int8)),
+                                                     "fortran_order": False, "shape": shape})
+            for row in rows:
+                f.write(row.astype(np.int8, copy=False).tobytes())
+        meta_path = output.rsplit(".", 1)[0] + "_meta.json"
+        with open(meta_path, "w") as f:
+            json.dump({"start": start, "goal": goal}, f)
+        print(f"Saved .npy to {output}")
         print(f"Saved metadata to {meta_path}")
+        return
+
+    out = open(output, "w") if output else sys.stdout
+    try:
+        if fmt == "json":
+            out.write('{"maze": [\n')
+            for i, row in enumerate(rows):
+                out.write(("," if i else "") + json.dumps(row.tolist()) + "\n")
+            out.write(f'], "start": {json.dumps(start)}, "goal": {json.dumps(goal)}}}\n')
+        else:
+            for row in rows:
+                out.write(ascii_render([row], style=style) + "\n")
+    finally:
+        if output:
+            out.close()
+
+def batch_path(output, index):
+    """Per-item output file for batches: out.npy -> out_000042.npy."""
+    root, ext = os.path.splitext(output)
+    return f"{root}_{index:06d}{ext}"
+
+def write_batch(results, fmt, style="blocks", output=None):
+    """Write each (index, seed, grid, start, goal) batch item as it arrives; return the count.
+
+    With *output* every maze goes to its own batch_path() file. On stdout, json
+    is written as one compact object per line and ascii mazes are separated
+    by blank lines.
+    """
+    n = 0
+    for index, seed, grid, start, goal in results:
+        if output:
+            write_maze(grid, start, goal, fmt, style, batch_path(output, index), verbose=False)
+        elif fmt == "json":
+            print(json.dumps({"index": index, "seed": seed, "maze": grid.tolist(),
+                              "start": start, "goal": goal}))
+        else:
+            print(ascii_render(grid, style=style) + "\n")
+        n += 1
+    return n
+
+def main():
+    parser = argparse.ArgumentParser(description="Maze generator CLI")
+    parser.add_argument("--algo", type=str, required=True, help="Algorithm to use (e.g., dfs, prims)")
+    parser.add_argument("--size", type=int, default=21, help="Size of the maze (must be odd)")
+    parser.add_argument("--height", type=int, default=None, help="Maze height in cells (default: same as --size)")
+    parser.add_argument("--max-cells", type=int, default=DEFAULT_MAX_CELLS,
+                        help=f"Area budget in cells (default: {DEFAULT_MAX_CELLS}, 0 for no limit)")
+    parser.add_argument("--format", type=str, default="json", choices=["json", "ascii", "npy", "packed"],
+                        help="Output format (packed = bit-packed .npz, see models/packed.py)")
+    parser.add_argument("--output", type=str, default=None, help="Output file (default: stdout)")
+    parser.add_argument("--style", type=str, default="blocks", choices=["blocks", "dots", "unicode", "roguelike"], help="ASCII style")
+    parser.add_argument("--save-meta", action="store_true", help="Save metadata about the maze generation")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="RNG seed; the same algo, size and seed always give the same maze")
+    parser.add_argument("--count", type=int, default=1,
+                        help="Number of mazes to generate; item i is seeded with --seed + i")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="Worker processes for --count or --tile (default: CPU count)")
+    parser.add_argument("--tile", type=int, default=None,
+                        help="Generate in parallel as TILE x TILE cell tiles (uses --jobs), stitched into one maze")
+    parser.add_argument("--unordered", action="store_true",
+                        help="With --count, write mazes as they finish instead of in order")
+    parser.add_argument("--stream", action="store_true",
+                        help="Write rows as they are generated in O(width) memory (eller only)")
+
+
+    args = parser.parse_args()
+    if args.count < 1:
+        parser.error("--count must be at least 1")
+    if args.count > 1:
+        if args.stream or args.tile:
+            parser.error("--stream and --tile cannot be combined with --count")
+        if args.format in ("npy", "packed") and not args.output:
+            parser.error(f"--format {args.format} with --count needs --output")
+        seed = args.seed if args.seed is not None else random.SystemRandom().randrange(1 << 32)
+        started = time.perf_counter()
+        results = generate_batch(args.algo, args.count, args.size, height=args.height, seed=seed,
+                                 jobs=args.jobs, ordered=not args.unordered,
+                                 max_cells=args.max_cells or None)
+        n = write_batch(results, args.format, args.style, args.output)
+        elapsed = time.perf_counter() - started
+        print(f"Generated {n} mazes in {elapsed:.2f}s ({n / elapsed:.1f} mazes/sec, base seed {seed})",
+              file=sys.stderr)
+        return
+
+    if args.tile:
+        if args.stream:
+            parser.error("--stream cannot be combined with --tile")
+        maze, start, goal = generate_tiled(args.algo, args.size, height=args.height, tile=args.tile,
+                                           jobs=args.jobs, seed=args.seed, max_cells=args.max_cells or None)
+        write_maze(maze, start, goal, args.format, args.style, args.output)
+    elif args.stream:
+        if args.algo != "eller":
+            parser.error("--stream is only supported with --algo eller")
+        if args.format == "packed":
+            parser.error("--stream does not support the packed format")
+        width, height = args.size, args.height or args.size
+        if args.max_cells and width * height > args.max_cells:
+            parser.error(f"Maze of {width}x{height} cells exceeds --max-cells {args.max_cells}")
+        start, goal = (1, 1), (2 * height - 1, 2 * width - 1)
+        stream_maze(eller.stream_rows(width, height, args.seed), (2 * height + 1, 2 * width + 1),
+                    start, goal, args.format, args.style, args.output)
+    else:
+        # npy output is generated directly into a memory-mapped output file
+        backing_file = None
+        if args.format == "npy" and args.output:
+            backing_file = args.output if args.output.endswith(".npy") else args.output + ".npy"
+        maze, start, goal = generate_maze(args.algo, args.size, height=args.height,
+                                          max_cells=args.max_cells or None, backing_file=backing_file,
+                                          seed=args.seed)
+        write_maze(maze, start, goal, args.format, args.style, backing_file or args.output)
 
-    if args.save_meta and args.output and args.format != "npy":
+    if args.save_meta and args.output and args.format not in ("npy", "packed"):
         meta = {
             "algo": args.algo,
             "size": args.size,
+            "height": args.height or args.size,
+            "seed": args.seed,
             "start": start,
             "goal": goal,
             "format": args.format,
@@ -1,7 +1,10 @@
 # mazegen/interface.py
 
+from typing import Optional
+
 import numpy as np
-from maze_generators import dfs, handk, kruskals, prims, recdiv, wilsons  # Add others as needed
+from maze_generators import dfs, eller, handk, kruskals, prims, recdiv, wilsons  # Add others as needed
+from models.maze import DEFAULT_MAX_CELLS
 
 GENERATOR_MAP = {
     "dfs": dfs.generate_maze,
@@ -9,12 +12,24 @@ GENERATOR_MAP = {
     "wilsons": wilsons.generate_maze,
     "recdiv": recdiv.generate_maze,
     "handk": handk.generate_maze,
-    "kruskals": kruskals.generate_maze
+    "kruskals": kruskals.generate_maze,
+    "eller": eller.generate_maze
 }
 
-def generate_maze(algo: str, size: int = 21) -> tuple[np.ndarray, tuple[int, int], tuple[int, int]]:
+def generate_maze(algo: str, size: int = 21, height: Optional[int] = None,
+                  max_cells: Optional[int] = DEFAULT_MAX_CELLS, backing_file: Optional[str] = None,
+                  seed: Optional[int] = None) -> tuple[np.ndarray, tuple[int, int], tuple[int, int]]:
+    """Generate a *size* x *height* (default square) maze and return (grid, start, goal).
+
+    *max_cells* is the area budget passed through to Maze; None disables it.
+    With *backing_file* the grid is a np.memmap over that .npy file.
+    The same (algo, size, height, seed) always yields the same maze, in any
+    thread or process, so seeded calls can be cached or farmed out to workers.
+    """
     if algo not in GENERATOR_MAP:
         raise ValueError(f"Unknown algorithm '{algo}'. Valid options: {list(GENERATOR_MAP.keys())}")
     
-    # We assume each generator returns (maze, start, goal)
-    return GENERATOR_MAP[algo](width=size, height=size)
+    # Each generator returns (Maze, start, goal); callers want the raw grid
+    maze, start, goal = GENERATOR_MAP[algo](width=size, height=height if height is not None else size,
+                                            max_cells=max_cells, backing_file=backing_file, seed=seed)
+    return maze.maze, start, goal
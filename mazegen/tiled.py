@@ -0,0 +1,124 @@
+# mazegen/tiled.py
+
+import os
+import random
+from multiprocessing import Pool, shared_memory
+from typing import Optional
+
+import numpy as np
+from mazegen.batch import item_seed
+from mazegen.interface import GENERATOR_MAP, generate_maze
+from models.maze import DEFAULT_MAX_CELLS, make_rng
+
+
+def _tiles(width: int, height: int, tile: int) -> list[tuple[int, int, int, int]]:
+    """Split a width x height cell grid into (x0, y0, w, h) tiles, row-major."""
+    return [(x0, y0, min(tile, width - x0), min(tile, height - y0))
+            for y0 in range(0, height, tile) for x0 in range(0, width, tile)]
+
+
+def _fill_tile(grid: np.ndarray, algo: str, x0: int, y0: int, w: int, h: int, seed: int):
+    """Generate one tile as its own perfect maze and copy its interior into *grid*.
+
+    Tiles own disjoint interiors; the walls between them are left closed.
+    """
+    tile, _, _ = generate_maze(algo, w, height=h, max_cells=None, seed=seed)
+    grid[2 * y0 + 1:2 * (y0 + h), 2 * x0 + 1:2 * (x0 + w)] = tile[1:-1, 1:-1]
+
+
+def _fill_shared_tile(job: tuple):
+    """Pool worker: attach to the shared grid and fill one tile (top-level so it pickles)."""
+    shm_name, shape, algo, x0, y0, w, h, seed = job
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        grid = np.ndarray(shape, dtype=np.int8, buffer=shm.buf)
+        _fill_tile(grid, algo, x0, y0, w, h, seed)
+        del grid  # Release the buffer export before closing
+    finally:
+        shm.close()
+
+
+def _stitch(grid: np.ndarray, tiles: list, cols: int, rnd: random.Random):
+    """Open one passage per edge of a random spanning tree of the tile graph.
+
+    Every tile is a spanning tree of its own cells, so joining tiles along a
+    spanning tree of tiles leaves the whole grid a perfect maze.
+    """
+    n = len(tiles)
+    edges = [(i, i + 1, True) for i in range(n) if (i + 1) % cols]   # East neighbours
+    edges += [(i, i + cols, False) for i in range(n - cols)]          # South neighbours
+    rnd.shuffle(edges)
+    parent = list(range(n))
+
+    def find(a: int) -> int:
+        while parent[a] != a:
+            parent[a] = parent[parent[a]]
+            a = parent[a]
+        return a
+
+    for a, b, east in edges:
+        ra, rb = find(a), find(b)
+        if ra == rb:
+            continue
+        parent[rb] = ra
+        ax, ay, aw, ah = tiles[a]
+        if east:  # Through the wall column left of tile b, at a random row
+            y = ay + rnd.randrange(ah)
+            grid[2 * y + 1, 2 * (ax + aw)] = 1
+        else:           # Through the wall row above tile b, at a random column
+            x = ax + rnd.randrange(aw)
+            grid[2 * (ay + ah), 2 * x + 1] = 1
+
+
+def generate_tiled(algo: str, size: int = 21, height: Optional[int] = None, tile: int = 256,
+                   jobs: Optional[int] = None, seed: Optional[int] = None,
+                   max_cells: Optional[int] = DEFAULT_MAX_CELLS
+                   ) -> tuple[np.ndarray, tuple[int, int], tuple[int, int]]:
+    """Generate a *size* x *height* maze as *tile* x *tile* cell tiles in parallel.
+
+    Each tile is generated with *algo* (any GENERATOR_MAP name) by a worker
+    process writing straight into a shared-memory grid, then the tiles are
+    joined over a random spanning tree of the tile graph. Returns (grid, start,
+    goal) like generate_maze(). Tile i is seeded with item_seed(seed, i), so
+    the maze depends on (algo, size, height, tile, seed) but not on *jobs*
+    (default os.cpu_count(); 1 runs in-process).
+
+    The maze is perfect, but tile seams are visible in its texture: there is
+    exactly one passage between any two tree-adjacent tiles.
+    """
+    if algo not in GENERATOR_MAP:
+        raise ValueError(f"Unknown algorithm '{algo}'. Valid options: {list(GENERATOR_MAP.keys())}")
+    width, height = size, height if height is not None else size
+    if width < 1 or height < 1 or tile < 1:
+        raise ValueError("Maze and tile dimensions must be at least 1.")
+    if max_cells is not None and width * height > max_cells:
+        raise ValueError(f"Maze of {width}x{height} cells exceeds the budget of {max_cells} cells "
+                         f"(pass a larger max_cells to allow it).")
+    if seed is None:
+        seed = random.SystemRandom().randrange(1 << 32)
+
+    tiles = _tiles(width, height, tile)
+    shape = (2 * height + 1, 2 * width + 1)
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(tiles)))
+    if jobs == 1:
+        grid = np.zeros(shape, dtype=np.int8)
+        for i, (x0, y0, w, h) in enumerate(tiles):
+            _fill_tile(grid, algo, x0, y0, w, h, item_seed(seed, i))
+    else:
+        shm = shared_memory.SharedMemory(create=True, size=shape[0] * shape[1])
+        try:
+            shared = np.ndarray(shape, dtype=np.int8, buffer=shm.buf)
+            shared[:] = 0
+            work = [(shm.name, shape, algo, x0, y0, w, h, item_seed(seed, i))
+                    for i, (x0, y0, w, h) in enumerate(tiles)]
+            with Pool(jobs) as pool:
+                for _ in pool.imap_unordered(_fill_shared_tile, work):
+                    pass
+            grid = shared.copy()
+            del shared
+        finally:
+            shm.close()
+            shm.unlink()
+
+    _stitch(grid, tiles, -(-width // tile), make_rng(item_seed(seed, len(tiles)))[1])
+    return grid, (1, 1), (2 * height - 1, 2 * width - 1)
@@ -0,0 +1,93 @@
+# models/adjacency.py
+"""CSR adjacency over the open squares of a maze grid, shared by the solvers."""
+import numpy as np
+from typing import Tuple
+
+UNSET = -1                    # Scratch fill for "no parent / not visited"
+INF = np.iinfo(np.int32).max  # Scratch fill for "no distance yet"
+
+
+class Adjacency:
+    """Compressed sparse row graph of a grid's open squares.
+
+    Every open grid square is a node, numbered in row-major order. The
+    neighbours of node v are `indices[indptr[v]:indptr[v + 1]]`, listed east,
+    west, south, north. `ys`/`xs` give each node's grid-space position, and
+    `node_of` maps a flat grid index (gy * cols + gx) to its node, or -1 for
+    a wall.
+
+    The arrays are int32 NumPy arrays; the `*_mv` memoryviews over them give
+    plain-int element access for the solvers' Python loops. scratch() hands
+    out per-node work arrays that are reused across solves.
+    """
+
+    def __init__(self, grid):
+        open_ = np.asarray(grid) != 0
+        rows, cols = open_.shape
+        flat = open_.ravel()
+        sq = np.flatnonzero(flat)
+        n = len(sq)
+        self.rows, self.cols, self.n = rows, cols, n
+
+        self.node_of = np.full(rows * cols, -1, dtype=np.int32)
+        self.node_of[sq] = np.arange(n, dtype=np.int32)
+        ys, xs = np.divmod(sq, cols)
+        self.ys, self.xs = ys.astype(np.int32), xs.astype(np.int32)
+
+        nbrs = np.full((n, 4), -1, dtype=np.int32)
+        for d, (ok, off) in enumerate(((xs < cols - 1, 1), (xs > 0, -1),
+                                       (ys < rows - 1, cols), (ys > 0, -cols))):
+            at = sq[ok] + off
+            nbrs[ok, d] = self.node_of[at]
+        has = nbrs >= 0
+        self.indptr = np.zeros(n + 1, dtype=np.int32)
+        np.cumsum(has.sum(axis=1), out=self.indptr[1:])
+        self.indices = nbrs[has]  # Row-major, so each node keeps the E, W, S, N order
+
+        self.indptr_mv = memoryview(self.indptr)
+        self.indices_mv = memoryview(self.indices)
+        self.ys_mv = memoryview(self.ys)
+        self.xs_mv = memoryview(self.xs)
+        self._scratch = {}
+
+    def scratch(self, name: str, fill: int) -> memoryview:
+        """Per-node int32 work array *name*, reset to *fill*, as a memoryview.
+
+        The buffer is allocated on first use and reused by later solves on
+        the same maze, so only the O(n) reset is paid per solve. Concurrent
+        solves on one maze must therefore not share a *name*.
+        """
+        buf = self._scratch.get(name)
+        if buf is None:
+            buf = self._scratch[name] = np.empty(self.n, dtype=np.int32)
+        buf.fill(fill)
+        return memoryview(buf)
+
+    def node(self, pos: Tuple[int, int]) -> int:
+        """Node of grid-space *pos* (-1 if it is a wall)."""
+        return int(self.node_of[pos[0] * self.cols + pos[1]])
+
+    def pos(self, v: int) -> Tuple[int, int]:
+        """Grid-space (gy, gx) of node *v*."""
+        return self.ys_mv[v], self.xs_mv[v]
+
+    def neighbours(self, v: int) -> np.ndarray:
+        """Neighbour nodes of *v* (a view into `indices`)."""
+        return self.indices[self.indptr[v]:self.indptr[v + 1]]
+
+    def values(self, grid: np.ndarray) -> np.ndarray:
+        """Per-node values of the grid-shaped array *grid* (e.g. square costs)."""
+        grid = np.asarray(grid)
+        if grid.shape != (self.rows, self.cols):
+            raise ValueError(f"Expected a grid of shape {(self.rows, self.cols)}, got {grid.shape}")
+        return grid.reshape(-1)[self.ys.astype(np.int64) * self.cols + self.xs].astype(np.int64)
+
+    def path(self, nodes) -> list:
+        """Grid-space positions of a sequence of nodes."""
+        ys, xs = self.ys_mv, self.xs_mv
+        return [(ys[v], xs[v]) for v in nodes]
+
+    @property
+    def nbytes(self) -> int:
+        arrays = [self.node_of, self.ys, self.xs, self.indptr, self.indices, *self._scratch.values()]
+        return sum(a.nbytes for a in arrays)
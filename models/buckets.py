@@ -0,0 +1,44 @@
+# models/buckets.py
+"""Bucket (Dial's) priority queue for searches with small integer costs."""
+from typing import Any, List, Tuple
+
+
+class BucketQueue:
+    """Monotone priority queue over integer keys with O(1) push and pop.
+
+    Keys index a ring of `span + 1` buckets, so every pushed key must lie in
+    [key, key + span], where `key` is the smallest key still queued (a
+    Dijkstra search with edge costs <= span satisfies this). pop() scans
+    forward from `key` to the next non-empty bucket; over a whole search that
+    scanning is bounded by the final key, not by the number of operations.
+    Items with equal keys come out last-in, first-out.
+    """
+
+    __slots__ = ("_buckets", "_size", "_count", "key")
+
+    def __init__(self, span: int, key: int = 0):
+        if span < 0:
+            raise ValueError("span must be non-negative")
+        self._size = span + 1
+        self._buckets: List[List[Any]] = [[] for _ in range(self._size)]
+        self._count = 0
+        self.key = key
+
+    def push(self, key: int, item: Any):
+        """Queue *item* under *key*, which must be within span of `self.key`."""
+        self._buckets[key % self._size].append(item)
+        self._count += 1
+
+    def pop(self) -> Tuple[int, Any]:
+        """Remove and return (key, item) for a smallest key. The queue must be non-empty."""
+        buckets, size, key = self._buckets, self._size, self.key
+        bucket = buckets[key % size]
+        while not bucket:
+            key += 1
+            bucket = buckets[key % size]
+        self.key = key
+        self._count -= 1
+        return key, bucket.pop()
+
+    def __len__(self) -> int:
+        return self._count
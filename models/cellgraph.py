@@ -0,0 +1,64 @@
+# models/cellgraph.py
+"""Flat-index cell graph shared by the maze generators."""
+import numpy as np
+from typing import Tuple
+
+# Direction ids, in the order of the offset tables below
+EAST, WEST, SOUTH, NORTH = 0, 1, 2, 3
+
+
+def mask_dirs(order: Tuple[int, ...] = (EAST, WEST, SOUTH, NORTH)) -> Tuple[Tuple[int, ...], ...]:
+    """Table of the valid directions (in *order*) for each 4-bit move mask.
+
+    Indexing it with `moves[c]` gives a cell's neighbour directions without
+    allocating, in whatever preference order an algorithm needs.
+    """
+    return tuple(tuple(d for d in order if mask >> d & 1) for mask in range(16))
+
+
+class CellGraph:
+    """The cells of a width x height maze as flat indices c = y * width + x.
+
+    Everything is precomputed once per maze so the generators' inner loops
+    only do integer arithmetic and memoryview reads/writes:
+
+    * `step[d]`: offset from a cell to its neighbour in direction d.
+    * `wall_step[d]`: offset, in the flattened grid, from a cell's square to
+      the wall square in direction d; twice that reaches the neighbour's square.
+    * `moves[c]`: bitmask of the directions that stay inside the maze (bit d).
+    * `squares`: memoryview of the flattened grid, written in place.
+    """
+
+    def __init__(self, grid: np.ndarray, width: int, height: int):
+        if not grid.flags.c_contiguous:
+            raise ValueError("CellGraph needs a C-contiguous grid to write through.")
+        self.width = width
+        self.height = height
+        self.n = width * height
+        self.cols = 2 * width + 1
+        self.step = (1, -1, width, -width)
+        self.wall_step = (1, -1, self.cols, -self.cols)
+        self.squares = memoryview(grid.reshape(-1))
+
+        y, x = np.divmod(np.arange(self.n, dtype=np.int64), width)
+        moves = ((x < width - 1) * (1 << EAST) | (x > 0) * (1 << WEST)
+                 | (y < height - 1) * (1 << SOUTH) | (y > 0) * (1 << NORTH))
+        self.moves = memoryview(moves.astype(np.uint8))
+
+    def flags(self) -> memoryview:
+        """Fresh zeroed uint8 per-cell array (visited marks, states, ...)."""
+        return memoryview(np.zeros(self.n, dtype=np.uint8))
+
+    def square(self, c: int) -> int:
+        """Flat grid index of cell *c*'s square."""
+        y, x = divmod(c, self.width)
+        return (2 * y + 1) * self.cols + 2 * x + 1
+
+    def squares_of(self, cells: np.ndarray) -> np.ndarray:
+        """Vectorized square() over an array of cells."""
+        y, x = np.divmod(cells, self.width)
+        return (2 * y + 1) * self.cols + 2 * x + 1
+
+    def cell_at(self, gy: int, gx: int) -> int:
+        """Cell whose square is at grid-space (gy, gx)."""
+        return (gy >> 1) * self.width + (gx >> 1)
@@ -0,0 +1,85 @@
+# models/history.py
+"""Fixed-capacity animation history backed by a preallocated int32 ring buffer."""
+import numpy as np
+from typing import Iterator, Tuple
+
+
+class StepHistory:
+    """Ring buffer of animation steps, each an int32 row (gy, gx, wy, wx).
+
+    Only the most recent *capacity* steps are kept, and the cap is enforced
+    while steps are recorded. Each step is written twice, at i and
+    i + capacity, so the retained steps are always one contiguous slice of
+    the buffer and view() never copies. The buffer (32 bytes per retained
+    step) is allocated on first use, so unanimated mazes pay nothing.
+    """
+
+    def __init__(self, capacity: int = 10000):
+        self.capacity = max(0, capacity)
+        self._buf = None     # (2 * capacity, 4) int32, allocated lazily
+        self._flat = None    # memoryview of _buf for plain-int scalar writes
+        self._next = 0       # Next write row in [0, capacity)
+        self._len = 0        # Retained steps (<= capacity)
+
+    def _alloc(self):
+        self._buf = np.zeros((2 * self.capacity, 4), dtype=np.int32)
+        self._flat = memoryview(self._buf.reshape(-1))
+
+    def push(self, gy: int, gx: int, wy: int, wx: int):
+        """Record one step: a first and second grid-space square (may be equal)."""
+        if not self.capacity:
+            return
+        if self._buf is None:
+            self._alloc()
+        flat, i = self._flat, 4 * self._next
+        j = i + 4 * self.capacity
+        flat[i] = flat[j] = gy
+        flat[i + 1] = flat[j + 1] = gx
+        flat[i + 2] = flat[j + 2] = wy
+        flat[i + 3] = flat[j + 3] = wx
+        self._next = (self._next + 1) % self.capacity
+        if self._len < self.capacity:
+            self._len += 1
+
+    def push_many(self, steps: np.ndarray):
+        """Record a (k, 4) array of steps in one vectorized write."""
+        steps = np.asarray(steps, dtype=np.int32).reshape(-1, 4)
+        if not self.capacity or not len(steps):
+            return
+        if self._buf is None:
+            self._alloc()
+        steps = steps[-self.capacity:]  # Older steps would be overwritten anyway
+        cap, k = self.capacity, len(steps)
+        rows = (self._next + np.arange(k)) % cap
+        self._buf[rows] = steps
+        self._buf[rows + cap] = steps
+        self._next = (self._next + k) % cap
+        self._len = min(cap, self._len + k)
+
+    def append(self, step: Tuple[Tuple[int, int], Tuple[int, int]]):
+        """Record a step given in the nested ((gy, gx), (wy, wx)) form."""
+        (gy, gx), (wy, wx) = step
+        self.push(gy, gx, wy, wx)
+
+    def view(self) -> np.ndarray:
+        """Read-only (len, 4) view of the retained steps, oldest first (no copy)."""
+        if not self._len:
+            return np.zeros((0, 4), dtype=np.int32)
+        start = self._next - self._len + self.capacity
+        view = self._buf[start:start + self._len]
+        view.flags.writeable = False
+        return view
+
+    def clear(self):
+        """Drop all steps and release the buffer."""
+        self._buf = self._flat = None
+        self._next = self._len = 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        return iter(self.view())
+
+    def __getitem__(self, index):
+        return self.view()[index]
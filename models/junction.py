@@ -0,0 +1,215 @@
+# models/junction.py
+"""Corridor-contracted graph over a maze's junctions and dead ends, shared by the solvers."""
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+from models.adjacency import Adjacency
+
+# Edge slots reserved at the end of indices/weights for attach()'s splices
+_SPLICES = 10
+
+
+class JunctionGraph:
+    """The junctions and dead ends of a maze, joined by weighted corridor edges.
+
+    Most open squares have exactly two neighbours, so they only relay a search
+    along a corridor. Here every other square (degree 0, 1, 3 or 4) is a
+    *key* node, numbered 0..k-1 in adjacency order, and each corridor becomes
+    one edge per direction whose weight is its length in steps. A ring of
+    corridor with no junction on it gets one of its squares promoted to key.
+
+    Edges are CSR like Adjacency: the edges of key v are `indptr[v]` to
+    `indptr[v + 1]`, going from `sources[e]` to `indices[e]` with weight
+    `weights[e]`, and the squares inside edge e are interior(e), in travel
+    order.
+
+    Start and goal squares may lie inside corridors, so a search first calls
+    attach(), which gives them ids k and k + 1 (or their key ids) and splices
+    them into their corridors with temporary edges. Those use the reserved
+    slots at the end of `indices`/`weights`, addressed by negative edge refs,
+    so a search visits the edges of id v with
+    `for e in extra.get(v) or range(indptr[v], indptr[v + 1])`. The splice
+    state lives on the graph, so as with scratch() concurrent searches on one
+    maze are not supported.
+    """
+
+    def __init__(self, adj: Adjacency):
+        indptr, indices = adj.indptr_mv, adj.indices_mv
+        n = adj.n
+        deg = np.diff(adj.indptr)
+        is_key = memoryview((deg != 2).astype(np.uint8))
+        via = np.full(n, -1, dtype=np.int32)  # Corridor square -> an edge running through it
+        at = np.zeros(n, dtype=np.int32)      # ... and its index among that edge's interior
+        via_mv, at_mv = memoryview(via), memoryview(at)
+        keys = np.flatnonzero(deg != 2).tolist()
+        src: List[int] = []
+        dst: List[int] = []
+        weights: List[int] = []
+        begins: List[int] = []
+        corridor: List[int] = []
+
+        def walk_from(u: int):
+            for k in range(indptr[u], indptr[u + 1]):
+                e, prev, cur, i = len(src), u, indices[k], 0
+                begins.append(len(corridor))
+                while not is_key[cur]:
+                    corridor.append(cur)
+                    via_mv[cur], at_mv[cur] = e, i
+                    i += 1
+                    nxt = indices[indptr[cur]]
+                    if nxt == prev:
+                        nxt = indices[indptr[cur] + 1]
+                    prev, cur = cur, nxt
+                src.append(u)
+                dst.append(cur)
+                weights.append(i + 1)
+
+        for u in keys:
+            walk_from(u)
+        for x in np.flatnonzero((via < 0) & (deg == 2)).tolist():
+            if via_mv[x] < 0:  # Still unvisited, so on a junction-free ring
+                is_key[x] = 1
+                keys.append(x)
+                walk_from(x)
+
+        k = len(keys)
+        self.adj, self.k = adj, k
+        self.key_of = np.full(n, -1, dtype=np.int32)
+        self.key_of[keys] = np.arange(k, dtype=np.int32)
+        self.nodes = np.array(keys + [0, 0], dtype=np.int32)  # Slots k, k + 1: attached endpoints
+        self.ys = adj.ys[self.nodes]
+        self.xs = adj.xs[self.nodes]
+        self.sources = self.key_of[src]  # Grouped by key, as walked
+        self.indptr = np.zeros(k + 1, dtype=np.int32)
+        np.cumsum(np.bincount(self.sources, minlength=k), out=self.indptr[1:])
+        self.indices = np.concatenate([self.key_of[dst], np.zeros(_SPLICES, dtype=np.int32)])
+        self.weights = np.array(weights + [0] * _SPLICES, dtype=np.int32)
+        self.begins = np.array(begins, dtype=np.int32)
+        self.corridor = np.array(corridor, dtype=np.int32)
+        self.via, self.at = via, at
+
+        self.indptr_mv = memoryview(self.indptr)
+        self.indices_mv = memoryview(self.indices)
+        self.sources_mv = memoryview(self.sources)
+        self.weights_mv = memoryview(self.weights)
+        self.ys_mv, self.xs_mv = memoryview(self.ys), memoryview(self.xs)
+        self._nodes = memoryview(self.nodes)
+        self._segments: List[List[int]] = []
+        self._scratch = {}
+
+    def scratch(self, name: str, fill: int) -> memoryview:
+        """Per-id int32 work array *name* (k + 2 entries), reset to *fill*.
+
+        Same contract as Adjacency.scratch(): reused across searches.
+        """
+        buf = self._scratch.get(name)
+        if buf is None:
+            buf = self._scratch[name] = np.empty(self.k + 2, dtype=np.int32)
+        buf.fill(fill)
+        return memoryview(buf)
+
+    def attach(self, source: int, target: int, cost: Optional[np.ndarray] = None
+               ) -> Tuple[int, int, Dict[int, List[int]], memoryview]:
+        """Ids of adjacency nodes *source* and *target* for a search, plus splices.
+
+        A key node keeps its key id. A corridor square gets id k (source) or
+        k + 1 (target) and edges both ways to the ends of its corridor, or
+        straight to the other endpoint if both share a corridor. Returns
+        (source id, target id, extra, weights): extra maps every id touched
+        by a splice to its full list of edge refs, splices included, and
+        weights gives each edge ref's cost.
+
+        Costs are corridor lengths unless *cost* gives a grid-shaped array of
+        positive integer costs for entering each open square; an edge then
+        costs the sum over the squares it enters.
+        """
+        k = self.k
+        extra: Dict[int, List[int]] = {}
+        segments = self._segments = []
+        indices, indptr = self.indices_mv, self.indptr_mv
+        if cost is None:
+            weights, node_cost = self.weights_mv, None
+        else:
+            node_cost = self.adj.values(cost)
+            if node_cost.size and node_cost.min() < 1:
+                raise ValueError("Square costs must be positive integers")
+            weights = memoryview(self._edge_costs(node_cost))
+
+        def link(u: int, v: int, inner: List[int]):
+            for a, b, seg in ((u, v, inner), (v, u, inner[::-1])):
+                segments.append(seg)
+                ref = -len(segments)
+                indices[ref] = b
+                self.weights_mv[ref] = len(inner) + 1
+                if node_cost is not None:
+                    weights[ref] = int(node_cost[seg].sum() + node_cost[self.nodes[b]])
+                if a not in extra:
+                    extra[a] = list(range(indptr[a], indptr[a + 1])) if a < k else []
+                extra[a].append(ref)
+
+        ids = []
+        for slot, x in ((k, source), (k + 1, target)):
+            key = int(self.key_of[x])
+            if key >= 0:
+                ids.append(key)
+            elif x == source and ids:  # Target is the source square
+                ids.append(ids[0])
+            else:
+                e, i = int(self.via[x]), int(self.at[x])
+                inner = self.interior(e)
+                # Set the slot first: links into it are priced at its square
+                self.nodes[slot] = x
+                self.ys[slot], self.xs[slot] = self.adj.pos(x)
+                link(slot, self.sources_mv[e], inner[:i][::-1])
+                link(slot, indices[e], inner[i + 1:])
+                ids.append(slot)
+        s, t = ids
+        if s == k and t == k + 1 and self.via[source] == self.via[target]:
+            i, j = int(self.at[source]), int(self.at[target])
+            inner = self.interior(int(self.via[source]))
+            link(s, t, inner[i + 1:j] if i < j else inner[j + 1:i][::-1])
+        return s, t, extra, weights
+
+    def _edge_costs(self, node_cost: np.ndarray) -> np.ndarray:
+        """Per-edge cost (interior squares plus the destination) for per-node *node_cost*."""
+        lengths = self.weights[:-_SPLICES].astype(np.int64)
+        sums = np.concatenate([[0], np.cumsum(node_cost[self.corridor])])
+        costs = np.zeros(self.weights.size, dtype=np.int64)
+        costs[:-_SPLICES] = (sums[self.begins + lengths - 1] - sums[self.begins]
+                             + node_cost[self.nodes[self.indices[:-_SPLICES]]])
+        return costs
+
+    def interior(self, ref: int) -> List[int]:
+        """Adjacency nodes strictly inside edge *ref* (a splice if negative), in travel order."""
+        if ref < 0:
+            return self._segments[-1 - ref]
+        b = self.begins[ref]
+        return self.corridor[b:b + self.weights[ref] - 1].tolist()
+
+    def expand(self, ids: List[int], via, backward: bool = False) -> List[int]:
+        """Adjacency nodes along the id path *ids*, corridors filled back in.
+
+        *via* holds the edge ref each id was reached by. For a forward search
+        via[ids[i]] leads from ids[i - 1] to ids[i]; with *backward* the ids
+        run towards the root of a reverse search, so via[ids[i]] leads from
+        ids[i + 1] to ids[i] and is walked in reverse.
+        """
+        nodes = self._nodes
+        out = [nodes[ids[0]]]
+        for i in range(1, len(ids)):
+            if backward:
+                out += self.interior(via[ids[i - 1]])[::-1]
+            else:
+                out += self.interior(via[ids[i]])
+            out.append(nodes[ids[i]])
+        return out
+
+    def pos(self, v: int) -> Tuple[int, int]:
+        """Grid-space (gy, gx) of id *v*."""
+        return self.ys_mv[v], self.xs_mv[v]
+
+    @property
+    def nbytes(self) -> int:
+        arrays = [self.key_of, self.nodes, self.ys, self.xs, self.indptr, self.indices, self.sources,
+                  self.weights, self.begins, self.corridor, self.via, self.at,
+                  *self._scratch.values()]
+        return sum(a.nbytes for a in arrays)
@@ -1,33 +1,89 @@
 # models/maze.py
+import json
+import os
 import numpy as np
 import random
-from typing import List, Tuple, Optional
+from itertools import chain, islice
+from typing import Any, Callable, Iterator, List, Tuple, Optional, Union
+
+from models.adjacency import Adjacency
+from models.junction import JunctionGraph
+from models.cellgraph import CellGraph, EAST, SOUTH, WEST, NORTH, mask_dirs
+from models.history import StepHistory
+from models.packed import PackedGrid
+
+# Algorithm name -> Maze method yielding its carving steps
+GENERATORS = {
+    "dfs": "_dfs_generate",
+    "handk": "_handk_generate",
+    "kruskals": "_kruskals_generate",
+    "prims": "_prims_generate",
+    "recdiv": "_recdiv_generate",
+    "wilsons": "_wilsons_generate",
+    "eller": "_eller_generate",
+}
+
+# Budget on maze area (width * height cells). The grid costs ~4 bytes per cell
+# and every generator/solver is linear in cells, so this bounds both memory and
+# run time. 4M cells (e.g. 2000x2000) is ~16 MB of grid; pass max_cells=None
+# to lift the budget entirely.
+DEFAULT_MAX_CELLS = 4_000_000
+
+
+def make_rng(seed: Optional[int] = None) -> Tuple[np.random.Generator, random.Random]:
+    """Return a NumPy Generator for *seed* and a stdlib Random seeded from it.
+
+    The Generator serves batched/vectorized draws; the Random serves the scalar
+    draws in the generators' inner loops, where it is several times faster.
+    Both are private to the caller, so concurrent mazes never share RNG state.
+    """
+    rng = np.random.default_rng(seed)
+    return rng, random.Random(int(rng.integers(1 << 63)))
+
 
 class Maze:
     def __init__(self, width: int, height: int, entry: Tuple[int, int] = (0, 0), 
-                 goal: Optional[Tuple[int, int]] = None, max_history_size: int = 10000):
+                 goal: Optional[Tuple[int, int]] = None, max_history_size: int = 10000,
+                 max_cells: Optional[int] = DEFAULT_MAX_CELLS, backing_file: Optional[str] = None,
+                 seed: Optional[int] = None):
         """Initialize maze with empty grid and coordinates.
         
         Args:
-            width (int): Width of the maze in cells (10-100, doubled internally for grid).
-            height (int): Height of the maze in cells (10-100, doubled internally for grid).
+            width (int): Width of the maze in cells (>= 1, doubled internally for grid).
+            height (int): Height of the maze in cells (>= 1, doubled internally for grid).
             entry (Tuple[int, int]): Starting position in cell-space (default: (0, 0)).
             goal (Tuple[int, int], optional): Goal position in cell-space (default: bottom-right).
-            max_history_size (int): Maximum number of animation steps to retain (default: 10000).
+            max_history_size (int): Maximum number of animation steps to retain, enforced while
+                generating by a ring buffer (default: 10000).
+            max_cells (int, optional): Budget on width * height (default: DEFAULT_MAX_CELLS,
+                None for no limit).
+            backing_file (str, optional): Back the grid with a memory-mapped .npy file at this
+                path instead of RAM; generators write straight into it (see flush()).
+            seed (int, optional): Seed for this maze's own RNG. Generating with the same
+                algorithm, size and seed always yields the same maze, in any thread or
+                process; None draws fresh entropy.
         
         Note: Grid size is 2 * width + 1 x 2 * height + 1 to accommodate walls.
         Raises:
-            ValueError: If dimensions or coordinates are invalid.
+            ValueError: If dimensions or coordinates are invalid, or the maze exceeds max_cells.
         """
         # Validate dimensions
         if not isinstance(width, int) or not isinstance(height, int):
             raise ValueError("Width and height must be integers.")
-        if not (10 <= width <= 100 and 10 <= height <= 100):
-            raise ValueError("Width and height must be between 10 and 100.")
+        if width < 1 or height < 1:
+            raise ValueError("Width and height must be at least 1.")
+        if max_cells is not None and width * height > max_cells:
+            raise ValueError(f"Maze of {width}x{height} cells exceeds the budget of {max_cells} cells "
+                             f"(pass a larger max_cells to allow it).")
         
         self.width = width
         self.height = height
-        self.maze = np.zeros((2 * height + 1, 2 * width + 1), dtype=np.int8)
+        shape = (2 * height + 1, 2 * width + 1)
+        if backing_file is not None:
+            # A fresh .npy file is zero-filled, matching np.zeros
+            self.maze = np.lib.format.open_memmap(backing_file, mode="w+", dtype=np.int8, shape=shape)
+        else:
+            self.maze = np.zeros(shape, dtype=np.int8)
         
         # Validate and convert entry to grid-space
         if not isinstance(entry, tuple) or len(entry) != 2:
@@ -49,12 +105,103 @@ class Maze:
             self.goal = (2 * (height - 1) + 1, 2 * (width - 1) + 1)  # Default to bottom-right
         
         self.solutions = []  # List of (path: List[Tuple[int, int]], solver_name: str)
-        self.history = []    # Animation steps, populated only if animate=True
+        self.history = StepHistory(max_history_size)  # Animation steps, populated only if animate=True
         self.max_history_size = max_history_size  # Cap for memory management
+        self.seed = seed
+        self.rng, self._random = make_rng(seed)
+        self._cache = {}  # Derived structures (adjacency, ...), see cached()
+        self.generation = 0  # Bumped each time the grid is (re)generated
         self.maze[self.start] = 1
         self.maze[self.goal] = 1
 
 
+    @classmethod
+    def from_grid(cls, grid: Union[np.ndarray, PackedGrid], start: Optional[Tuple[int, int]] = None,
+                  goal: Optional[Tuple[int, int]] = None, max_history_size: int = 10000) -> 'Maze':
+        """Wrap an existing grid (ndarray or PackedGrid) without copying it.
+
+        *start* and *goal* are in grid-space (as stored on Maze and in the CLI
+        metadata); they default to the top-left and bottom-right cells.
+        """
+        rows, cols = grid.shape
+        if rows < 3 or cols < 3 or rows % 2 == 0 or cols % 2 == 0:
+            raise ValueError(f"Grid shape {grid.shape} is not (2h+1, 2w+1)")
+        maze = cls.__new__(cls)
+        maze.width, maze.height = cols // 2, rows // 2
+        maze.maze = grid
+        maze.start = tuple(start) if start is not None else (1, 1)
+        maze.goal = tuple(goal) if goal is not None else (rows - 2, cols - 2)
+        maze.solutions = []
+        maze.history = StepHistory(max_history_size)
+        maze.max_history_size = max_history_size
+        maze.seed = None
+        maze.rng, maze._random = make_rng(None)
+        maze._cache = {}
+        maze.generation = 0
+        return maze
+
+    @classmethod
+    def load(cls, filename: str, mmap: bool = True) -> 'Maze':
+        """Load a maze saved as .npy (by mazegen or a backing_file) or packed .npz.
+
+        With *mmap* the .npy grid is memory-mapped read-only rather than read
+        into RAM. Start/goal come from the `<name>_meta.json` sidecar if present.
+        """
+        if filename.endswith(".npz"):
+            grid = PackedGrid.load(filename)
+        else:
+            grid = np.load(filename, mmap_mode="r" if mmap else None)
+        start = goal = None
+        meta_path = filename.rsplit(".", 1)[0] + "_meta.json"
+        if os.path.exists(meta_path):
+            with open(meta_path) as f:
+                meta = json.load(f)
+            start, goal = meta.get("start"), meta.get("goal")
+        return cls.from_grid(grid, start, goal)
+
+    def flush(self):
+        """Write a memory-mapped grid back to its file (no-op for in-memory grids)."""
+        if isinstance(self.maze, np.memmap):
+            self.maze.flush()
+
+    def pack(self) -> PackedGrid:
+        """Return the grid bit-packed as two wall bits per cell (see PackedGrid)."""
+        return PackedGrid.from_grid(self.maze)
+
+    def unpack(self) -> 'Maze':
+        """Replace a PackedGrid backing with the regular int8 grid, in place."""
+        if isinstance(self.maze, PackedGrid):
+            self.maze = self.maze.to_grid()
+        return self
+
+    def cached(self, key: str, build: Callable[['Maze'], Any]) -> Any:
+        """Return the derived structure *key*, building it with build(self) on first use.
+
+        Entries belong to the current grid object, so they are rebuilt if
+        `maze.maze` is replaced, and dropped when the maze is (re)generated.
+        Call invalidate() after editing the grid in place.
+        """
+        entry = self._cache.get(key)
+        if entry is None or entry[0] is not self.maze:
+            entry = self._cache[key] = (self.maze, build(self))
+        return entry[1]
+
+    def invalidate(self, keep: Tuple[str, ...] = ()):
+        """Drop every cached derived structure except the entries named in *keep*.
+
+        Structures that update themselves after an edit (see solvers.hpa)
+        pass their own key in *keep*.
+        """
+        self._cache = {key: entry for key, entry in self._cache.items() if key in keep}
+
+    def adjacency(self) -> Adjacency:
+        """CSR adjacency over the open grid squares, built once and cached."""
+        return self.cached("adjacency", lambda m: Adjacency(m.maze))
+
+    def junctions(self) -> JunctionGraph:
+        """Corridor-contracted junction graph over adjacency(), built once and cached."""
+        return self.cached("junctions", lambda m: JunctionGraph(m.adjacency()))
+
     def to_grid_space(self, cx: int, cy: int) -> Tuple[int, int]:
         """Convert cell-space (cx, cy) to grid-space (gy, gx)."""
         return 2 * cy + 1, 2 * cx + 1
@@ -67,291 +214,357 @@ class Maze:
 
     def generate(self, algorithm: str, animate: bool = False) -> 'Maze':
         """Generate maze using specified algorithm, optionally storing animation steps."""
+        steps = self._steps(algorithm, animate)
         self.history.clear()  # Reset history
-        if algorithm == "dfs":
-            self._dfs_generate(animate)
-        elif algorithm == "handk":
-            self._handk_generate(animate)
-        elif algorithm == "kruskals":
-            self._kruskals_generate(animate)         
-        elif algorithm == "prims":
-            self._prims_generate(animate)
-        elif algorithm == "recdiv":
-            self._recdiv_generate(animate)
-        elif algorithm == "wilsons":
-            self._wilsons_generate(animate)
-        else:
-            raise ValueError(f"Unknown algorithm: {algorithm}")
-        if len(self.history) > self.max_history_size:
-            self.history = self.history[-self.max_history_size:]  # Trim to max size
+        if not animate:
+            for _ in steps:  # Generators yield nothing when not animating
+                pass
+            self.invalidate()
+            return self
+        # Feed the step stream into the ring buffer in fixed-size vectorized chunks
+        flat = chain.from_iterable(steps)
+        while True:
+            chunk = np.fromiter(islice(flat, 4 * 65536), dtype=np.int32)
+            if not chunk.size:
+                break
+            self.history.push_many(chunk.reshape(-1, 4))
+        self.invalidate()
         return self
 
+    def iter_generate(self, algorithm: str) -> Iterator[Tuple[int, int, int, int]]:
+        """Generate lazily, yielding each (gy, gx, wy, wx) carving step as it happens.
+
+        The grid already reflects a step when it is yielded, so renderers and
+        exporters can consume the stream live in constant memory. Steps are not
+        added to `history`; the maze is complete once the iterator is exhausted.
+        """
+        return self._steps(algorithm, animate=True)
+
+    def _steps(self, algorithm: str, animate: bool) -> Iterator[Tuple[int, int, int, int]]:
+        """Validate eagerly, then return the algorithm's step generator."""
+        if isinstance(self.maze, PackedGrid):
+            raise ValueError("Packed grids are read-only; call unpack() before generating.")
+        if algorithm not in GENERATORS:
+            raise ValueError(f"Unknown algorithm: {algorithm}")
+        self.invalidate()
+        self.generation += 1
+        # Start from a blank grid (in place, so memmaps stay file-backed) as __init__ does
+        self.maze.fill(0)
+        self.maze[self.start] = 1
+        self.maze[self.goal] = 1
+        self.rng, self._random = make_rng(self.seed)  # Reseed: same seed, same maze on every call
+        return getattr(self, GENERATORS[algorithm])(animate)
+
 
     def _dfs_generate(self, animate: bool):
-        """DFS generation: carve paths from start using cell-space, store in grid-space."""
-        visited = set()
-        # Convert start to cell-space
-        start_cy, start_cx = self.to_cell_space(*self.start)
-        stack = [(start_cx, start_cy)]
-        visited.add((start_cx, start_cy))
+        """DFS generation: carve paths from the start cell on the shared CellGraph.
+
+        Side state is a flag per cell plus a stack of flat cell indices, so the
+        grid itself (possibly a memmap) is the only large structure touched.
+        """
+        g = CellGraph(self.maze, self.width, self.height)
+        squares, moves, step, wall_step, cols = g.squares, g.moves, g.step, g.wall_step, g.cols
+        square, shuffle = g.square, self._random.shuffle
+        visited = g.flags()
+        root = g.cell_at(*self.start)
+        visited[root] = 1
+        squares[square(root)] = 1
+        stack = [root]
+        order = [EAST, WEST, SOUTH, NORTH]  # Reshuffled in place before every expansion
         while stack:
-            cx, cy = stack.pop()
-            # Convert to grid-space for maze array
-            grid_y, grid_x = self.to_grid_space(cx, cy)
-            self.maze[grid_y, grid_x] = 1
-            dirs = [(1, 0), (-1, 0), (0, 1), (0, -1)]
-            random.shuffle(dirs)
-            for dx, dy in dirs:
-                nx, ny = cx + dx, cy + dy
-                if 0 <= nx < self.width and 0 <= ny < self.height and (nx, ny) not in visited:
-                    visited.add((nx, ny))
-                    # Wall between (cx, cy) and (nx, ny) in grid-space
-                    wall_x = grid_x + dx
-                    wall_y = grid_y + dy
-                    self.maze[wall_y, wall_x] = 1
-                    stack.append((nx, ny))
+            c = stack.pop()
+            sq, mask = square(c), moves[c]
+            shuffle(order)
+            for d in order:
+                if mask >> d & 1 and not visited[c + step[d]]:
+                    nc = c + step[d]
+                    visited[nc] = 1
+                    wall = sq + wall_step[d]
+                    squares[wall] = squares[wall + wall_step[d]] = 1  # Open the cell now so streamed steps show it
+                    stack.append(nc)
                     if animate:
-                        cell_g = self.to_grid_space(nx, ny)
-                        self.history.append((cell_g, (wall_y, wall_x)))
+                        yield (*divmod(wall + wall_step[d], cols), *divmod(wall, cols))
 
 
     def _handk_generate(self, animate: bool):
-        """Hunt-and-Kill: carve paths in cell-space, update grid-space maze."""
-        visited = set()
-        # Start at entry cell in cell-space
-        cx, cy = self.to_cell_space(*self.start)
-        
-        def visit(x: int, y: int):
-            gy, gx = self.to_grid_space(x, y)
-            self.maze[gy, gx] = 1
-            visited.add((x, y))
-            if animate:
-                self.history.append(((gy, gx), (gy, gx)))
-
-
-        def neigh(x: int, y: int):
-            for dx, dy in [(-1,0), (1,0), (0,-1), (0,1)]:
-                nx, ny = x + dx, y + dy
-                if 0 <= nx < self.width and 0 <= ny < self.height:
-                    yield nx, ny
-
-        visit(cx, cy)
+        """Hunt-and-Kill on the shared CellGraph.
 
+        The hunt is indexed: `hunt` flags unvisited cells with a visited neighbour
+        and `row_hunt` counts them per row, so each hunt resumes from the first
+        row that has one instead of rescanning the grid from row 0.
+        """
+        g = CellGraph(self.maze, self.width, self.height)
+        squares, moves, step, wall_step, cols = g.squares, g.moves, g.step, g.wall_step, g.cols
+        w, h = self.width, self.height
+        dirs = mask_dirs((WEST, EAST, NORTH, SOUTH))  # Neighbour preference of the row-major scan
+        visited = g.flags()
+        hunt = bytearray(g.n)        # Unvisited cells adjacent to a visited one (bytearray for find())
+        row_hunt = [0] * h
+        first_row = h                # No row above this one has hunt cells
+
+        def visit(c: int) -> int:
+            """Mark cell *c* visited, update the hunt index and return its square."""
+            nonlocal first_row
+            sq = g.square(c)
+            squares[sq] = 1
+            visited[c] = 1
+            if hunt[c]:
+                hunt[c] = 0
+                row_hunt[c // w] -= 1
+            for d in dirs[moves[c]]:
+                nc = c + step[d]
+                if not visited[nc] and not hunt[nc]:
+                    hunt[nc] = 1
+                    ny = nc // w
+                    row_hunt[ny] += 1
+                    if ny < first_row:
+                        first_row = ny
+            return sq
+
+        c = g.cell_at(*self.start)
+        sq = visit(c)
+        if animate:
+            gy, gx = divmod(sq, cols)
+            yield gy, gx, gy, gx
 
         while True:
-            unvis = [nb for nb in neigh(cx, cy) if nb not in visited]
+            unvis = [d for d in dirs[moves[c]] if not visited[c + step[d]]]
             if unvis:  # Kill phase
-                nx, ny = random.choice(unvis)
-                # Wall between (cx, cy) and (nx, ny) in grid-space using cell-space difference
-                cy_g, cx_g = self.to_grid_space(cx, cy)
-                wy = cy_g + (ny - cy)  # Scale cell difference to grid
-                wx = cx_g + (nx - cx)
-                self.maze[wy, wx] = 1
-                visit(nx, ny)
-                if animate:
-                    self.history.append(((wy, wx), (wy, wx)))
-                cx, cy = nx, ny
-            else:  # Hunt phase
-                found = False
-                for y in range(self.height):
-                    for x in range(self.width):
-                        if (x, y) in visited:
-                            continue
-                        if any(nb in visited for nb in neigh(x, y)):
-                            # Carve wall to the first visited neighbor
-                            nx, ny = next(nb for nb in neigh(x, y) if nb in visited)
-                            y_g, x_g = self.to_grid_space(x, y)
-                            wy = y_g + (ny - y)  # Scale cell difference to grid
-                            wx = x_g + (nx - x)
-                            self.maze[wy, wx] = 1
-                            visit(x, y)
-                            if animate:
-                                self.history.append(((wy, wx), (wy, wx)))
-                            cx, cy = x, y
-                            found = True
-                            break
-                    if found:
-                        break
-                if not found:
+                d = self._random.choice(unvis)
+            else:  # Hunt phase: first hunt cell in row-major order, as a full scan would find
+                while first_row < h and not row_hunt[first_row]:
+                    first_row += 1
+                if first_row == h:
                     break
+                c = hunt.find(1, first_row * w, (first_row + 1) * w)
+                # Carve towards the first visited neighbor
+                d = next(d for d in dirs[moves[c]] if visited[c + step[d]])
+                sq = g.square(c)
+            wall = sq + wall_step[d]
+            squares[wall] = 1
+            if unvis:
+                c += step[d]
+            sq = visit(c)
+            if animate:
+                gy, gx = divmod(sq, cols)
+                wy, wx = divmod(wall, cols)
+                yield gy, gx, gy, gx
+                yield wy, wx, wy, wx
 
     def _prims_generate(self, animate: bool):
-        """Prim's: grow maze from start in cell-space, carve paths in grid-space."""
-        visited = set()
-        frontier = []
-
-        # Start at entry cell in cell-space
-        cx, cy = self.to_cell_space(*self.start)
-        visited.add((cx, cy))
-        gy, gx = self.to_grid_space(cx, cy)
-        self.maze[gy, gx] = 1
+        """Prim's: grow the maze from the start cell on the shared CellGraph.
 
-        def add_frontier(cx, cy):
-            """Add unvisited neighbors in cell-space to frontier with their parent."""
-            for dx, dy in [(-1,0),(1,0),(0,-1),(0,1)]:
-                nx, ny = cx + dx, cy + dy
-                if 0 <= nx < self.width and 0 <= ny < self.height and (nx, ny) not in visited:
-                    frontier.append((nx, ny, cx, cy))  # neighbor + parent
+        The frontier is an array of cells with swap-remove pops and a per-cell
+        state flag, so each cell enters it once and every step is O(1). A popped
+        cell joins the maze through a random already-visited neighbour.
+        """
+        g = CellGraph(self.maze, self.width, self.height)
+        squares, moves, step, wall_step, cols = g.squares, g.moves, g.step, g.wall_step, g.cols
+        randrange, choice = self._random.randrange, self._random.choice
+        dirs = mask_dirs((WEST, EAST, NORTH, SOUTH))
+        state = g.flags()  # 0 = unseen, 1 = in frontier, 2 = visited
+        frontier = []
 
-        add_frontier(cx, cy)
+        root = g.cell_at(*self.start)
+        state[root] = 2
+        squares[g.square(root)] = 1
+        for d in dirs[moves[root]]:
+            state[root + step[d]] = 1
+            frontier.append(root + step[d])
         if animate:
-            self.history.append(((gy, gx), (gy, gx)))
+            gy, gx = self.start
+            yield gy, gx, gy, gx
 
         while frontier:
-            idx = random.randrange(len(frontier))
-            nx, ny, px, py = frontier.pop(idx)  # neighbor and parent in cell-space
-            if (nx, ny) in visited:
-                continue
-            visited.add((nx, ny))
-            # Carve wall and cell in grid-space
-            py_g, px_g = self.to_grid_space(px, py)
-            ny_g, nx_g = self.to_grid_space(nx, ny)
-            # Wall is between parent (px,py) and neighbor (nx,ny)
-            wy = py_g + (ny - py)  # Adjust based on cell-space difference
-            wx = px_g + (nx - px)
-            self.maze[wy, wx] = 1
-            gy, gx = ny_g, nx_g
-            self.maze[gy, gx] = 1
+            # Swap-remove a random frontier cell
+            idx = randrange(len(frontier))
+            c = frontier[idx]
+            frontier[idx] = frontier[-1]
+            frontier.pop()
+            state[c] = 2
+            # Join through a random visited neighbour (there is at least one)
+            nbs = dirs[moves[c]]
+            d = choice([d for d in nbs if state[c + step[d]] == 2])
+            sq = g.square(c)
+            wall = sq + wall_step[d]
+            squares[wall] = squares[sq] = 1
             if animate:
-                self.history.append(((wy, wx), (gy, gx)))
-            add_frontier(nx, ny)
+                yield (*divmod(wall, cols), *divmod(sq, cols))
+            for d in nbs:
+                nc = c + step[d]
+                if not state[nc]:
+                    state[nc] = 1
+                    frontier.append(nc)
 
     def _wilsons_generate(self, animate: bool):
-        """Wilson's: random walks in cell-space, carve paths in grid-space."""
-        # Convert start to cell-space
-        root = self.to_cell_space(*self.start)
-        in_tree = {root}
-        ry, rx = self.to_grid_space(*root)
-        self.maze[ry, rx] = 1
-        if animate:
-            self.history.append(((ry, rx), (ry, rx)))
+        """Wilson's: loop-erased random walks on the shared CellGraph.
 
-        all_cells = [(x, y) for x in range(self.width) for y in range(self.height)]
-        while len(in_tree) < len(all_cells):
+        The walk is kept as one exit direction per cell (re-entering a cell just
+        overwrites its exit, which erases the loop), and walk starts are drawn from
+        a swap-remove index of the cells not yet in the tree.
+        """
+        g = CellGraph(self.maze, self.width, self.height)
+        squares, moves, step, wall_step, cols = g.squares, g.moves, g.step, g.wall_step, g.cols
+        in_tree = g.flags()
+        exit_dir = g.flags()             # Last direction taken out of each walked cell
+        remaining = list(range(g.n))     # Cells not in the tree yet ...
+        slot = list(range(g.n))          # ... and each cell's position in that list
+
+        def add_to_tree(c: int):
+            in_tree[c] = 1
+            i, last = slot[c], remaining[-1]
+            remaining[i], slot[last] = last, i
+            remaining.pop()
+
+        root = g.cell_at(*self.start)
+        add_to_tree(root)
+        squares[g.square(root)] = 1
+        if animate:
+            ry, rx = self.start
+            yield ry, rx, ry, rx
+
+        draw = self._random.getrandbits  # Two random bits are a direction id
+        while remaining:
+            first = cur = self._random.choice(remaining)
+            while not in_tree[cur]:
+                d = draw(2)
+                if moves[cur] >> d & 1:
+                    exit_dir[cur] = d
+                    cur += step[d]
+
+            # Follow the surviving exits from the walk start to the tree
             walk = []
-            cx, cy = random.choice([c for c in all_cells if c not in in_tree])
-            while (cx, cy) not in in_tree:
-                walk.append((cx, cy))
-                dx, dy = random.choice([(1,0),(-1,0),(0,1),(0,-1)])
-                nx, ny = cx + dx, cy + dy
-                if 0 <= nx < self.width and 0 <= ny < self.height:
-                    cx, cy = nx, ny
-                    if (cx, cy) in walk:
-                        walk = walk[:walk.index((cx, cy))+1]
-            prev = (cx, cy)
-            for px, py in reversed(walk):
-                gy, gx = self.to_grid_space(px, py)
-                self.maze[gy, gx] = 1
-                py_g, px_g = self.to_grid_space(*prev)
-                # Wall is midpoint between current and previous cell in grid-space
-                wy, wx = (gy + py_g) // 2, (gx + px_g) // 2
-                self.maze[wy, wx] = 1
+            cur = first
+            while not in_tree[cur]:
+                walk.append(cur)
+                cur += step[exit_dir[cur]]
+
+            # Carve from the tree back towards the walk start
+            for c in reversed(walk):
+                sq = g.square(c)
+                wall = sq + wall_step[exit_dir[c]]
+                squares[sq] = squares[wall] = 1
                 if animate:
-                    self.history.append(((wy, wx), (gy, gx)))
-                in_tree.add((px, py))
-                prev = (px, py)
+                    yield (*divmod(wall, cols), *divmod(sq, cols))
+                add_to_tree(c)
 
     def _recdiv_generate(self, animate: bool):
-        """Recursive Division: divide grid-space, create walls with passages."""
-        def pick_odd(start, length):
-            """Return all odd indices in [start + 1 … start + length - 1]."""
-            return [i for i in range(start + 1, start + length, 2)]
+        """Recursive Division: divide grid-space, create walls with passages.
 
-        def divide(x, y, w, h, border_steps, step_idx):
-            """Recursively divide space, interleave with border animation."""
+        Regions come off an explicit work stack in the order the recursive
+        version visited them. Each wall is a single slice assignment, and
+        wall/passage positions are drawn arithmetically from the odd indices.
+        """
+        # Initialize grid as all paths (1), unlike other algorithms starting with walls
+        self.maze[1:-1, 1:-1] = 1
+        randrange, choice = self._random.randrange, self._random.choice
+        stack = [(1, 1, 2 * self.width - 1, 2 * self.height - 1)]  # (x, y, w, h) in grid-space
+        while stack:
+            x, y, w, h = stack.pop()
             if w < 3 or h < 3:
-                return step_idx
-            horizontal = h > w if w != h else random.choice([True, False])
+                continue
+            horizontal = h > w if w != h else choice([True, False])
 
             if horizontal:
-                wy = random.choice(pick_odd(y, h - 1))
-                passage_x = random.choice(pick_odd(x - 1, w + 1))
-                for gx in range(x, x + w):
-                    if gx == passage_x:
-                        continue
-                    self.maze[wy, gx] = 0
-                    if animate:
-                        self.history.append(((wy, gx), (wy, gx)))  # Record wall square
-                step_idx = divide(x, y, w, wy - y, border_steps, step_idx)
-                step_idx = divide(x, wy + 1, w, y + h - wy - 1, border_steps, step_idx)
+                wy = y + 1 + 2 * randrange((h - 1) // 2)      # Even row inside the region
+                passage_x = x + 2 * randrange((w + 1) // 2)   # Odd column in [x, x + w)
+                self.maze[wy, x:x + w] = 0
+                self.maze[wy, passage_x] = 1
+                if animate:  # Record wall squares
+                    gxs = np.arange(x, x + w)
+                    yield from _square_steps(wy, gxs[gxs != passage_x])
+                # Push the far side first so the near side is divided first
+                stack.append((x, wy + 1, w, y + h - wy - 1))
+                stack.append((x, y, w, wy - y))
             else:
-                wx = random.choice(pick_odd(x, w - 1))
-                passage_y = random.choice(pick_odd(y - 1, h + 1))
-                for gy in range(y, y + h):
-                    if gy == passage_y:
-                        continue
-                    self.maze[gy, wx] = 0
-                    if animate:
-                        self.history.append(((gy, wx), (gy, wx)))  # Record wall square
-                step_idx = divide(x, y, wx - x, h, border_steps, step_idx)
-                step_idx = divide(wx + 1, y, x + w - wx - 1, h, border_steps, step_idx)
-            return step_idx
+                wx = x + 1 + 2 * randrange((w - 1) // 2)
+                passage_y = y + 2 * randrange((h + 1) // 2)
+                self.maze[y:y + h, wx] = 0
+                self.maze[passage_y, wx] = 1
+                if animate:
+                    gys = np.arange(y, y + h)
+                    yield from _square_steps(gys[gys != passage_y], wx)
+                stack.append((wx + 1, y, x + w - wx - 1, h))
+                stack.append((x, y, wx - x, h))
 
-        # Initialize grid as all paths (1), unlike other algorithms starting with walls
-        self.maze[1:-1, 1:-1] = 1
         if animate:
-            w, h = self.maze.shape[1], self.maze.shape[0]
-            border_steps = [
-                ((0, gx), (0, gx)) for gx in range(w)  # Top
-            ] + [
-                ((h-1, gx), (h-1, gx)) for gx in range(w)  # Bottom
-            ] + [
-                ((gy, 0), (gy, 0)) for gy in range(1, h-1)  # Left
-            ] + [
-                ((gy, w-1), (gy, w-1)) for gy in range(1, h-1)  # Right
-            ]
-            step_idx = 0
-            total_steps = len(border_steps)
-            # Interleave border and maze steps
-            divide(1, 1, 2 * self.width - 1, 2 * self.height - 1, border_steps, 0)
-            while step_idx < total_steps:
-                if step_idx < total_steps:
-                    self.history.append(border_steps[step_idx])
-                    self.maze[border_steps[step_idx][0][0], border_steps[step_idx][0][1]] = 0
-                    step_idx += 1
+            # Replay the (already solid) outer border after the divisions
+            gh, gw = self.maze.shape
+            yield from _square_steps(0, np.arange(gw))                 # Top
+            yield from _square_steps(gh - 1, np.arange(gw))            # Bottom
+            yield from _square_steps(np.arange(1, gh - 1), 0)          # Left
+            yield from _square_steps(np.arange(1, gh - 1), gw - 1)     # Right
+
+    def _eller_generate(self, animate: bool):
+        """Eller's: fill the grid row by row from eller_rows()."""
+        for gy, row in enumerate(_eller_rows(self.width, self.height, self._random)):
+            self.maze[gy] = row
+            if animate:
+                yield from _square_steps(gy, np.flatnonzero(row))
 
     def _kruskals_generate(self, animate: bool):
-        """Kruskal's: connect cells in cell-space, carve paths in grid-space."""
-        class DisjointSet:
-            def __init__(self):   self.p = {}
-            def find(self, x):
-                if self.p[x] != x: self.p[x] = self.find(self.p[x])
-                return self.p[x]
-            def union(self, a, b):
-                ra, rb = self.find(a), self.find(b)
-                if ra != rb:
-                    self.p[rb] = ra
-                    return True
-                return False
-
-        ds = DisjointSet()
-        cells = [(x, y) for x in range(self.width) for y in range(self.height)]
-        for c in cells: ds.p[c] = c
+        """Kruskal's: connect cells in cell-space, carve paths in grid-space.
+
+        Cells are flat indices (y * width + x) in an int32 union-find with
+        union-by-rank and path halving; the candidate walls are edge ids visited
+        in one vectorized random permutation.
+        """
+        g = CellGraph(self.maze, self.width, self.height)
+        w, h, n = g.width, g.height, g.n
 
         # Every interior cell becomes a white square first (paths)
-        for cx, cy in cells:
-            gy, gx = self.to_grid_space(cx, cy)
-            self.maze[gy, gx] = 1
-            if animate:
-                self.history.append(((gy, gx), (gy, gx)))  # Record carved cell
-
-        # Candidate edges = walls between neighbouring cells
-        edges = []
-        for x, y in cells:
-            if x < self.width-1: edges.append(((x, y), (x+1, y)))  # East wall
-            if y < self.height-1: edges.append(((x, y), (x, y+1)))  # South wall
-        random.shuffle(edges)
-
-        for (ax, ay), (bx, by) in edges:
-            if ds.union((ax, ay), (bx, by)):  # Wall can be removed
-                ay_g, ax_g = self.to_grid_space(ax, ay)
-                by_g, bx_g = self.to_grid_space(bx, by)
-                # Wall is between cells, use the grid-space wall position
-                wy = (ay_g + by_g) // 2 if ay != by else ay_g
-                wx = (ax_g + bx_g) // 2 if ax != bx else ax_g
-                self.maze[wy, wx] = 1  # Remove wall to create path
-                if animate:
-                    self.history.append(((wy, wx), (wy, wx)))
+        self.maze[1::2, 1::2] = 1
+        if animate:  # Record carved cells, column by column
+            yield from _square_steps(np.tile(2 * np.arange(h) + 1, w), np.repeat(2 * np.arange(w) + 1, h))
+
+        # Candidate edges = walls between neighbouring cells. Edge ids 0..n_east-1 are east
+        # walls (row-major over the w-1 left cells of each row), the rest south walls of
+        # cells 0..n-w-1; endpoints and wall squares are derived from the id, so the
+        # only O(cells) array besides the union-find is one int32 permutation.
+        n_east = (w - 1) * h
+        order = np.arange(n_east + n - w, dtype=np.int32)
+        self.rng.shuffle(order)
+
+        def endpoints(ids: np.ndarray):
+            east = ids < n_east
+            a = np.where(east, ids // max(w - 1, 1) * w + ids % max(w - 1, 1), ids - n_east)
+            return a, a + np.where(east, g.step[EAST], g.step[SOUTH]), east
+
+        parent = np.arange(n, dtype=np.int32)
+        rank = np.zeros(n, dtype=np.int8)
+        p, r = memoryview(parent), memoryview(rank)  # Plain-int element access
+
+        def find(x: int) -> int:
+            while p[x] != x:
+                p[x] = p[p[x]]  # Path halving
+                x = p[x]
+            return x
+
+        carved = []  # Edge indices whose wall is removed, in carving order
+        joins = 0
+        chunk = 1 << 16
+        for lo in range(0, len(order), chunk):
+            part = order[lo:lo + chunk]
+            edge_a, edge_b, _ = endpoints(part)
+            for e, a, b in zip(part.tolist(), edge_a.tolist(), edge_b.tolist()):
+                ra, rb = find(a), find(b)
+                if ra == rb:
+                    continue
+                if r[ra] < r[rb]:
+                    ra, rb = rb, ra
+                p[rb] = ra
+                if r[ra] == r[rb]:
+                    r[ra] += 1
+                carved.append(e)
+                joins += 1
+            if joins == n - 1:  # Spanning tree complete
+                break
+
+        a, _, east = endpoints(np.asarray(carved, dtype=np.int64))
+        walls = g.squares_of(a) + np.where(east, g.wall_step[EAST], g.wall_step[SOUTH])
+        np.asarray(g.squares)[walls] = 1  # Remove walls to create paths
+        if animate:
+            yield from _square_steps(*np.divmod(walls, g.cols))
 
     def add_solution(self, path: List[Tuple[int, int]], solver_name: str):
         """Add a solution path with its solver name."""
@@ -360,11 +573,11 @@ class Maze:
     def to_json(self) -> dict:
         """Serialize maze data for saving."""
         return {
-            "maze": self.maze.tolist(),
+            "maze": np.asarray(self.maze).tolist(),
             "start": self.start,
             "goal": self.goal,
             "solutions": self.solutions,
-            "history": self.history  # Include history for animation replay
+            "history": self.history.view().tolist()  # Include history for animation replay
         }
 
     def save_to_png(self, filename: str):
@@ -391,6 +604,85 @@ class Maze:
         """Manually clear solution paths to free memory when no longer needed."""
         self.solutions.clear()
 
-    def get_animation_steps(self) -> List[Tuple[Tuple[int, int], Tuple[int, int]]]:
-        """Return history for animation (empty if not generated with animate=True)."""
-        return self.history
\ No newline at end of file
+    def get_animation_steps(self) -> np.ndarray:
+        """Return history for animation as a zero-copy (steps, 4) int32 view of
+        (gy, gx, wy, wx) rows (empty if not generated with animate=True)."""
+        return self.history.view()
+
+
+def eller_rows(width: int, height: int, seed: Optional[int] = None) -> Iterator[np.ndarray]:
+    """Yield the 2 * height + 1 grid rows of an Eller's-algorithm maze, top to bottom.
+
+    Only the set labels of the current cell row are kept (O(width) memory), so
+    arbitrarily tall mazes can be streamed without allocating the full grid.
+    Each yielded row is a fresh int8 array of length 2 * width + 1. The rows
+    match Maze(width, height, seed=seed).generate("eller").
+    """
+    return _eller_rows(width, height, make_rng(seed)[1])
+
+
+def _eller_rows(width: int, height: int, rnd: random.Random) -> Iterator[np.ndarray]:
+    """eller_rows() drawing from *rnd*."""
+    w, cols = width, 2 * width + 1
+    labels = list(range(w))  # Set label per column, compacted to 0..w-1 every row
+    yield np.zeros(cols, dtype=np.int8)  # Top border
+
+    def find(a: int) -> int:
+        while parent[a] != a:
+            parent[a] = parent[parent[a]]
+            a = parent[a]
+        return a
+
+    for y in range(height):
+        last = y == height - 1
+        parent = list(range(w))  # Union-find over this row's labels
+
+        # Join horizontally adjacent cells of different sets (all of them on the last row)
+        cell_row = np.zeros(cols, dtype=np.int8)
+        cell_row[1::2] = 1
+        east = []
+        for x in range(w - 1):
+            a, b = find(labels[x]), find(labels[x + 1])
+            if a != b and (last or rnd.getrandbits(1)):
+                parent[b] = a
+                east.append(2 * x + 2)
+        cell_row[east] = 1
+        yield cell_row
+
+        if last:
+            break
+
+        # Every set carries on downwards through at least one cell
+        roots = [find(lab) for lab in labels]
+        members = {}
+        for x, root in enumerate(roots):
+            members.setdefault(root, []).append(x)
+        down = bytearray(w)
+        for xs in members.values():
+            picked = [x for x in xs if rnd.getrandbits(1)]
+            for x in picked or [rnd.choice(xs)]:
+                down[x] = 1
+        south_row = np.zeros(cols, dtype=np.int8)
+        south_row[[2 * x + 1 for x in range(w) if down[x]]] = 1
+        yield south_row
+
+        # Carried cells keep their set, the rest start new ones; relabel to 0..w-1
+        relabel, fresh = {}, 0
+        for x in range(w):
+            if not down[x]:
+                labels[x] = fresh
+                fresh += 1
+            elif roots[x] in relabel:
+                labels[x] = relabel[roots[x]]
+            else:
+                labels[x] = relabel[roots[x]] = fresh
+                fresh += 1
+
+    yield np.zeros(cols, dtype=np.int8)  # Bottom border
+
+
+def _square_steps(ys, xs) -> Iterator[Tuple[int, int, int, int]]:
+    """Single-square steps (y, x, y, x) for each broadcast pair of *ys*, *xs*."""
+    ys, xs = np.broadcast_arrays(np.asarray(ys), np.asarray(xs))
+    ys, xs = ys.ravel().tolist(), xs.ravel().tolist()
+    return zip(ys, xs, ys, xs)
@@ -2,21 +2,25 @@
 """A* (A‑star) solver for Maze objects."""
 from models.maze import Maze
 
-import heapq
-from typing import Tuple, List, Optional, Dict
+import numpy as np
+from typing import Tuple, List, Optional
 
-# NumPy is only needed for type annotations, not imported here
+from models.adjacency import INF, UNSET
+from models.buckets import BucketQueue
+from solvers.landmarks import Landmarks
 
 def heuristic(a: Tuple[int, int], b: Tuple[int, int]) -> int:
     """Manhattan distance between *a* and *b*."""
     return abs(a[0] - b[0]) + abs(a[1] - b[1])
 
 
-def reconstruct_path(came_from: Dict[Tuple[int, int], Tuple[int, int]],
-                     current: Tuple[int, int]) -> List[Tuple[int, int]]:
-    """Return the path from the start node to *current*."""
+def reconstruct_path(came_from, current: int) -> List[int]:
+    """Return the nodes on the path from the start node to *current*.
+
+    *came_from* is an int parent array in which the start is its own parent.
+    """
     path = [current]
-    while current in came_from:
+    while came_from[current] != current:
         current = came_from[current]
         path.append(current)
     path.reverse()
@@ -27,13 +31,23 @@ def solve(maze: Maze,
           start: Tuple[int, int],
           goal: Tuple[int, int],
           render=None,
-          color: Optional[Tuple[int, int, int]] = (0, 255, 0)
+          color: Optional[Tuple[int, int, int]] = (0, 255, 0),
+          weights: Optional[np.ndarray] = None,
+          landmarks: int = 0
           ) -> List[Tuple[int, int]]:
     """A* shortest‑path solver.
 
     Combines Dijkstra's algorithm with a heuristic (Manhattan distance)
-    to find an optimal path efficiently. Returns the path or an empty
-    list if none exists or the run is cancelled via *render*.
+    to find an optimal path efficiently. Searches the corridor-contracted
+    junction graph and expands the corridors of the winning route at the
+    end. f-scores are small integers, so the open set is a bucket queue.
+    Optional *weights* is a grid-shaped array of positive integer costs for
+    entering each square (default 1); the heuristic is then scaled by the
+    cheapest square. With *landmarks* > 0 the heuristic also takes the
+    triangle-inequality bounds from that many landmarks' distance tables
+    (cached on the maze, see solvers.landmarks), which prunes far more in
+    twisty mazes. Returns the path or an empty list if none exists or the
+    run is cancelled via *render*.
     """
     # --- Sanity checks --------------------------------------------------
     rows, cols = maze.maze.shape
@@ -51,27 +65,45 @@ def solve(maze: Maze,
     if maze.maze[goal] == 0:
         raise ValueError(f"Goal position {goal} is a wall")
 
-    # Priority queue holds (f_score, cell)
-    open_set: List[Tuple[int, Tuple[int, int]]] = []
-    heapq.heappush(open_set, (0, start))
-
-    came_from: Dict[Tuple[int, int], Tuple[int, int]] = {}
-    g_score: Dict[Tuple[int, int], int] = {start: 0}
-    f_score: Dict[Tuple[int, int], int] = {start: heuristic(start, goal)}
-
-    visited: set[Tuple[int, int]] = set()
+    # Search the maze's cached junction graph: corridors are single weighted edges
+    adj, jg = maze.adjacency(), maze.junctions()
+    source, target, extra, cost = jg.attach(adj.node(start), adj.node(goal), weights)
+    indptr, indices = jg.indptr_mv, jg.indices_mv
+    scale = 1 if weights is None else int(np.asarray(weights)[maze.maze != 0].min())
+
+    # Heuristic for every node up front: Manhattan distance, or the landmark
+    # bound where that is larger, times the cheapest square cost
+    goal_y, goal_x = goal
+    h = np.abs(jg.ys.astype(np.int64) - goal_y) + np.abs(jg.xs - goal_x)
+    if landmarks:
+        h = np.maximum(h, Landmarks.of(maze, landmarks).bounds(adj.node(goal)))
+    h = memoryview(h * scale)
+
+    # Bucket queue of nodes by f_score. The heuristic is consistent, so an
+    # edge raises f by at most twice its cost over the current minimum.
+    f_start = h[source]
+    open_set = BucketQueue(2 * int(np.max(cost)), key=f_start)
+    open_set.push(f_start, source)
+
+    # Per-node state in reusable int32 scratch arrays indexed by node
+    came_from = jg.scratch("parent", UNSET)
+    came_via = jg.scratch("via", UNSET)
+    g_score = jg.scratch("g", INF)
+    visited = jg.scratch("closed", 0)
+    came_from[source] = source
+    g_score[source] = 0
 
     while open_set:
         if render and not render.running:
             return []
 
-        _, current = heapq.heappop(open_set)
-        if current in visited:
+        _, current = open_set.pop()
+        if visited[current]:
             continue
-        visited.add(current)
+        visited[current] = 1
 
-        if current == goal:
-            path = reconstruct_path(came_from, current)
+        if current == target:
+            path = adj.path(jg.expand(reconstruct_path(came_from, current), came_via))
             maze.add_solution(path, "A* Search")
             if render and render.running:
                 for pos in path:
@@ -79,22 +111,21 @@ def solve(maze: Maze,
                     render.update()
             return path
 
-        for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-            neighbor = (current[0] + dy, current[1] + dx)
-            if (in_bounds(neighbor)
-                    and maze.maze[neighbor] == 1
-                    and neighbor not in visited):
-
-                tentative_g = g_score[current] + 1
-                if tentative_g < g_score.get(neighbor, float('inf')):
-                    came_from[neighbor] = current
-                    g_score[neighbor] = tentative_g
-                    f = tentative_g + heuristic(neighbor, goal)
-                    f_score[neighbor] = f
-                    heapq.heappush(open_set, (f, neighbor))
+        g_current = g_score[current]
+        for e in extra.get(current) or range(indptr[current], indptr[current + 1]):
+            neighbor = indices[e]
+            tentative_g = g_current + cost[e]
+            if not visited[neighbor] and tentative_g < g_score[neighbor]:
+                came_from[neighbor] = current
+                came_via[neighbor] = e
+                g_score[neighbor] = tentative_g
+                open_set.push(tentative_g + h[neighbor], neighbor)
+                if render:  # Show the corridor squares the edge covers too
+                    for x in jg.interior(e):
+                        render.mark_cell(adj.pos(x), color=(100, 100, 255))
 
         if render and render.running:
-            render.mark_cell(current, color=(100, 100, 255))  # Trail
+            render.mark_cell(jg.pos(current), color=(100, 100, 255))  # Trail
             render.update()
 
     return []
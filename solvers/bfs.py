@@ -2,14 +2,14 @@
 """BFS algorithm solver for Maze objects."""
 from collections import deque
 from typing import Tuple, List, Optional
+from models.adjacency import UNSET
 from models.maze import Maze
 
 
-def _reconstruct(parent: dict[Tuple[int, int], Tuple[int, int]],
-                 cur: Tuple[int, int]) -> List[Tuple[int, int]]:
-    """Build path by walking backwards through the *parent* map."""
+def _reconstruct(parent, cur: int) -> List[int]:
+    """Build path by walking backwards through the int *parent* array."""
     path = [cur]
-    while cur in parent:
+    while parent[cur] != cur:
         cur = parent[cur]
         path.append(cur)
     return path[::-1]
@@ -32,29 +32,32 @@ def solve(maze: Maze, start: Tuple[int, int], goal: Tuple[int, int],
     if not (inside(start) and inside(goal)) or grid[start] == 0 or grid[goal] == 0:
         raise ValueError("Start/goal invalid or in wall")
 
-    q = deque([start])
-    parent = {}
-    visited = {start}
+    adj = maze.adjacency()  # Cached CSR graph over open squares
+    indptr, indices = adj.indptr_mv, adj.indices_mv
+    source, target = adj.node(start), adj.node(goal)
+
+    q = deque([source])
+    parent = adj.scratch("parent", UNSET)  # Also the visited mark; reused across solves
+    parent[source] = source
 
     while q:
         if render and not render.running:
             return []
         cur = q.popleft()
-        if cur == goal:
-            path = _reconstruct(parent, cur)
+        if cur == target:
+            path = adj.path(_reconstruct(parent, cur))
             maze.add_solution(path, "BFS")
             if render:
                 for pos in path:
                     render.mark_cell(pos, color)
                     render.update()
             return path
-        for dy, dx in [(0,1), (0,-1), (1,0), (-1,0)]:
-            nb = (cur[0] + dy, cur[1] + dx)
-            if inside(nb) and grid[nb] == 1 and nb not in visited:
-                visited.add(nb)
+        for k in range(indptr[cur], indptr[cur + 1]):
+            nb = indices[k]
+            if parent[nb] == UNSET:
                 parent[nb] = cur
                 q.append(nb)
                 if render:
-                    render.mark_cell(nb, (150, 150, 255))
+                    render.mark_cell(adj.pos(nb), (150, 150, 255))
                     render.update()
     return []
\ No newline at end of file
@@ -1,26 +1,16 @@
 # solvers/bidirectional.py
-"""Bidirectional BFS solver for Maze objects."""
-from collections import deque
+"""Bidirectional Dijkstra solver for Maze objects."""
+import heapq
 from typing import Tuple, List, Optional
+from models.adjacency import INF, UNSET
 from models.maze import Maze
 
 
-def _reconstruct(parent_from_start: dict[Tuple[int, int], Tuple[int, int]],
-                 parent_from_goal: dict[Tuple[int, int], Tuple[int, int]],
-                 meet: Tuple[int, int]) -> List[Tuple[int, int]]:
-    """Return the path that connects *start* and *goal* through *meet*."""
-    # path from start to meet (inclusive)
-    path: List[Tuple[int, int]] = []
-    n = meet
-    while n in parent_from_start:
-        path.append(n)
-        n = parent_from_start[n]
-    path.reverse()
-
-    # path from meet to goal (exclusive of meet)
-    n = meet
-    while n in parent_from_goal:
-        n = parent_from_goal[n]
+def _chain(parent, n: int) -> List[int]:
+    """Nodes from *n* up to the root of an int *parent* array (root is its own parent)."""
+    path = [n]
+    while parent[n] != n:
+        n = parent[n]
         path.append(n)
     return path
 
@@ -31,65 +21,69 @@ def solve(maze: Maze,
           render=None,
           color: Optional[Tuple[int, int, int]] = (0, 255, 0)
           ) -> List[Tuple[int, int]]:
-    """Bidirectional BFS pathfinder.
+    """Bidirectional Dijkstra pathfinder.
 
-    Explores simultaneously from *start* and *goal* until the frontiers
-    meet, guaranteeing a shortest path. Returns that path or an empty
-    list if none exists or the run is cancelled via *render*.
+    Grows one search from *start* and one from *goal* over the maze's
+    junction graph (corridors are weighted edges) until no shorter meeting
+    point is possible, guaranteeing a shortest path. Returns that path or
+    an empty list if none exists or the run is cancelled via *render*.
     """
     grid = maze.maze  # 0/1 ndarray
     h, w = grid.shape
     inside = lambda p: 0 <= p[0] < h and 0 <= p[1] < w
+    if not (inside(start) and inside(goal)) or grid[start] == 0 or grid[goal] == 0:
+        raise ValueError("Start/goal invalid")
+
+    adj, jg = maze.adjacency(), maze.junctions()  # Cached; corridors are weighted edges
+    source, target, extra, weights = jg.attach(adj.node(start), adj.node(goal))
+    indptr, indices = jg.indptr_mv, jg.indices_mv
 
-    qs, qg = deque([start]), deque([goal])
-    came_s: dict[Tuple[int, int], Tuple[int, int]] = {}
-    came_g: dict[Tuple[int, int], Tuple[int, int]] = {}
-    vis_s: set[Tuple[int, int]] = {start}
-    vis_g: set[Tuple[int, int]] = {goal}
+    # Per-side distance, parent and arrival edge, in reusable scratch arrays
+    g_s, g_g = jg.scratch("g", INF), jg.scratch("g_goal", INF)
+    came_s, came_g = jg.scratch("parent", UNSET), jg.scratch("parent_goal", UNSET)
+    via_s, via_g = jg.scratch("via", UNSET), jg.scratch("via_goal", UNSET)
+    g_s[source] = g_g[target] = 0
+    came_s[source] = source
+    came_g[target] = target
+    best, meet = (0, source) if source == target else (INF, UNSET)
 
-    while qs and qg:
+    sides = (([(0, source)], g_s, came_s, via_s, g_g, (150, 150, 255)),
+             ([(0, target)], g_g, came_g, via_g, g_s, (200, 200, 100)))
+    qs, qg = sides[0][0], sides[1][0]
+    # Any path through an unsettled node costs at least the two queue minima
+    while qs and qg and qs[0][0] + qg[0][0] < best:
         if render and not render.running:
             return []
 
-        # Expand from start side
-        cur = qs.popleft()
-        for dy, dx in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-            nb = (cur[0] + dy, cur[1] + dx)
-            if inside(nb) and grid[nb] == 1 and nb not in vis_s:
-                vis_s.add(nb)
-                came_s[nb] = cur
-                qs.append(nb)
-                if render:
-                    render.mark_cell(nb, (150, 150, 255))
-                    render.update()
-                if nb in vis_g:  # met the other search
-                    path = _reconstruct(came_s, came_g, nb)
-                    maze.add_solution(path, "Bidirectional")
-                    if render:
-                        for p in path:
-                            render.mark_cell(p, color)
-                            render.update()
-                    return path
-
-        # Expand from goal side
-        cur = qg.popleft()
-        for dy, dx in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-            nb = (cur[0] + dy, cur[1] + dx)
-            if inside(nb) and grid[nb] == 1 and nb not in vis_g:
-                vis_g.add(nb)
-                came_g[nb] = cur
-                qg.append(nb)
-                if render:
-                    render.mark_cell(nb, (200, 200, 100))
-                    render.update()
-                if nb in vis_s:
-                    path = _reconstruct(came_s, came_g, nb)
-                    maze.add_solution(path, "Bidirectional")
-                    if render:
-                        for p in path:
-                            render.mark_cell(p, color)
-                            render.update()
-                    return path
-    return []
-
+        # Expand the side with the nearer frontier
+        pq, dist, came, via, other, shade = sides[qs[0][0] > qg[0][0]]
+        d, cur = heapq.heappop(pq)
+        if d > dist[cur]:  # Stale entry
+            continue
+        for e in extra.get(cur) or range(indptr[cur], indptr[cur + 1]):
+            nb = indices[e]
+            nd = d + weights[e]
+            if nd < dist[nb]:
+                dist[nb] = nd
+                came[nb] = cur
+                via[nb] = e
+                heapq.heappush(pq, (nd, nb))
+                if render:  # Show the corridor squares the edge covers too
+                    for x in jg.interior(e):
+                        render.mark_cell(adj.pos(x), shade)
+                if other[nb] != INF and nd + other[nb] < best:  # The searches meet at nb
+                    best, meet = nd + other[nb], nb
+        if render:
+            render.mark_cell(jg.pos(cur), shade)
+            render.update()
 
+    if meet == UNSET:
+        return []
+    ids = _chain(came_s, meet)[::-1]
+    path = adj.path(jg.expand(ids, via_s) + jg.expand(_chain(came_g, meet), via_g, backward=True)[1:])
+    maze.add_solution(path, "Bidirectional")
+    if render:
+        for p in path:
+            render.mark_cell(p, color)
+            render.update()
+    return path
@@ -1,14 +1,14 @@
 # solvers/dfs.py
 """Depth‑First Search (DFS) solver for Maze objects."""
 from typing import Tuple, List, Optional
+from models.adjacency import UNSET
 from models.maze import Maze
 
 
-def _reconstruct(parent: dict[Tuple[int, int], Tuple[int, int]],
-                 cur: Tuple[int, int]) -> List[Tuple[int, int]]:
-    """Build path by walking backwards through *parent* until the start."""
+def _reconstruct(parent, cur: int) -> List[int]:
+    """Build path by walking backwards through the int *parent* array until the start."""
     path = [cur]
-    while cur in parent:
+    while parent[cur] != cur:
         cur = parent[cur]
         path.append(cur)
     return path[::-1]
@@ -32,9 +32,13 @@ def solve(maze: Maze,
     if not (inside(start) and inside(goal)) or grid[start] == 0 or grid[goal] == 0:
         raise ValueError("Start/goal invalid")
 
-    stack: List[Tuple[int, int]] = [start]
-    parent: dict[Tuple[int, int], Tuple[int, int]] = {}
-    visited: set[Tuple[int, int]] = {start}
+    adj = maze.adjacency()  # Cached CSR graph over open squares
+    indptr, indices = adj.indptr_mv, adj.indices_mv
+    source, target = adj.node(start), adj.node(goal)
+
+    stack: List[int] = [source]
+    parent = adj.scratch("parent", UNSET)  # Also the visited mark; reused across solves
+    parent[source] = source
     frontier_cl = (160, 160, 160)  # grey exploration dots
 
     while stack:
@@ -42,8 +46,8 @@ def solve(maze: Maze,
             return []
 
         cur = stack.pop()
-        if cur == goal:
-            path = _reconstruct(parent, cur)
+        if cur == target:
+            path = adj.path(_reconstruct(parent, cur))
             maze.add_solution(path, "DFS")
             if render:
                 for p in path:
@@ -52,13 +56,12 @@ def solve(maze: Maze,
             return path
 
         if render:
-            render.mark_cell(cur, frontier_cl)  # comment out for silent DFS
+            render.mark_cell(adj.pos(cur), frontier_cl)  # comment out for silent DFS
             render.update()
 
-        for dy, dx in ((0, 1), (0, -1), (1, 0), (-1, 0)):
-            nb = (cur[0] + dy, cur[1] + dx)
-            if inside(nb) and grid[nb] == 1 and nb not in visited:
-                visited.add(nb)
+        for k in range(indptr[cur], indptr[cur + 1]):
+            nb = indices[k]
+            if parent[nb] == UNSET:
                 parent[nb] = cur
                 stack.append(nb)
 
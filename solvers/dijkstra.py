@@ -1,15 +1,16 @@
 # solvers/dijkstra.py
 """Dijkstra's algorithm solver for Maze objects."""
-import heapq
+import numpy as np
 from typing import List, Tuple, Optional
+from models.adjacency import INF, UNSET
+from models.buckets import BucketQueue
 from models.maze import Maze
 
 
-def reconstruct(parent: dict[Tuple[int, int], Tuple[int, int]],
-                cur: Tuple[int, int]) -> List[Tuple[int, int]]:
-    """Build path by walking backwards through *parent*."""
+def reconstruct(parent, cur: int) -> List[int]:
+    """Build path by walking backwards through the int *parent* array."""
     path = [cur]
-    while cur in parent:
+    while parent[cur] != cur:
         cur = parent[cur]
         path.append(cur)
     return path[::-1]
@@ -19,12 +20,16 @@ def solve(maze: Maze,
           start: Tuple[int, int],
           goal: Tuple[int, int],
           render=None,
-          color: Optional[Tuple[int, int, int]] = (0, 255, 0)
+          color: Optional[Tuple[int, int, int]] = (0, 255, 0),
+          weights: Optional[np.ndarray] = None
           ) -> List[Tuple[int, int]]:
     """Dijkstra shortest‑path solver.
 
-    Returns an optimal path from *start* to *goal* or an empty list if
-    none exists / run is cancelled via *render*.
+    Runs on the maze's junction graph, where each corridor is one weighted
+    edge, with a bucket queue since all costs are small integers. Optional
+    *weights* is a grid-shaped array of positive integer costs for entering
+    each square (default 1). Returns a cheapest path from *start* to *goal*
+    or an empty list if none exists / run is cancelled via *render*.
     """
     grid = maze.maze
     h, w = grid.shape
@@ -32,10 +37,17 @@ def solve(maze: Maze,
     if not (inside(start) and inside(goal)) or grid[start] == 0 or grid[goal] == 0:
         raise ValueError("Invalid start / goal")
 
-    pq: list[tuple[int, Tuple[int, int]]] = [(0, start)]
-    g: dict[Tuple[int, int], int] = {start: 0}
-    parent: dict[Tuple[int, int], Tuple[int, int]] = {}
-    seen: set[Tuple[int, int]] = set()
+    adj, jg = maze.adjacency(), maze.junctions()  # Cached; corridors are weighted edges
+    source, target, extra, cost = jg.attach(adj.node(start), adj.node(goal), weights)
+    indptr, indices = jg.indptr_mv, jg.indices_mv
+
+    pq = BucketQueue(int(np.max(cost)))  # Queued keys never exceed the minimum by more
+    pq.push(0, source)
+    g = jg.scratch("g", INF)           # Reusable int32 per-node arrays
+    parent = jg.scratch("parent", UNSET)
+    via = jg.scratch("via", UNSET)
+    g[source] = 0
+    parent[source] = source
 
     frontier_colour = (160, 160, 160)
 
@@ -43,13 +55,12 @@ def solve(maze: Maze,
         if render and not render.running:
             return []
 
-        d, cur = heapq.heappop(pq)
-        if cur in seen:
+        d, cur = pq.pop()
+        if d > g[cur]:  # Stale entry; cur was settled at a smaller distance
             continue
-        seen.add(cur)
 
-        if cur == goal:  # reached goal
-            path = reconstruct(parent, cur)
+        if cur == target:  # reached goal
+            path = adj.path(jg.expand(reconstruct(parent, cur), via))
             maze.add_solution(path, "Dijkstra")
             if render:
                 for p in path:
@@ -57,18 +68,20 @@ def solve(maze: Maze,
                     render.update()
             return path
 
-        for dy, dx in ((0, 1), (0, -1), (1, 0), (-1, 0)):
-            nb = (cur[0] + dy, cur[1] + dx)
-            if inside(nb) and grid[nb] == 1 and nb not in seen:
-                nd = d + 1
-                if nd < g.get(nb, 1e9):
-                    g[nb] = nd
-                    parent[nb] = cur
-                    heapq.heappush(pq, (nd, nb))
+        for e in extra.get(cur) or range(indptr[cur], indptr[cur + 1]):
+            nb = indices[e]
+            nd = d + cost[e]
+            if nd < g[nb]:
+                g[nb] = nd
+                parent[nb] = cur
+                via[nb] = e
+                pq.push(nd, nb)
+                if render:  # Show the corridor squares the edge covers too
+                    for x in jg.interior(e):
+                        render.mark_cell(adj.pos(x), frontier_colour)
 
         if render:
-            render.mark_cell(cur, frontier_colour)
+            render.mark_cell(jg.pos(cur), frontier_colour)
             render.update()
 
     return []
-
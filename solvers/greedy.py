@@ -2,6 +2,7 @@
 """Greedy Best‑First Search (GBFS) solver for Maze objects."""
 import heapq
 from typing import Tuple, List, Optional
+from models.adjacency import UNSET
 from models.maze import Maze
 
 
@@ -10,11 +11,10 @@ def heuristic(a: Tuple[int, int], b: Tuple[int, int]) -> int:
     return abs(a[0] - b[0]) + abs(a[1] - b[1])
 
 
-def _reconstruct(parent: dict[Tuple[int, int], Tuple[int, int]],
-                 cur: Tuple[int, int]) -> List[Tuple[int, int]]:
-    """Rebuild path from *start* to *cur* using the *parent* map."""
+def _reconstruct(parent, cur: int) -> List[int]:
+    """Rebuild path from *start* to *cur* using the int *parent* array."""
     path = [cur]
-    while cur in parent:
+    while parent[cur] != cur:
         cur = parent[cur]
         path.append(cur)
     return path[::-1]
@@ -42,31 +42,37 @@ def solve(maze: Maze,
     if not (inside(start) and inside(goal)) or grid[start] == 0 or grid[goal] == 0:
         raise ValueError("Start/goal invalid")
 
-    pq: list[tuple[int, Tuple[int, int]]] = [(heuristic(start, goal), start)]
-    came: dict[Tuple[int, int], Tuple[int, int]] = {}
-    seen: set[Tuple[int, int]] = set()
+    adj = maze.adjacency()  # Cached CSR graph over open squares
+    indptr, indices, ys, xs = adj.indptr_mv, adj.indices_mv, adj.ys_mv, adj.xs_mv
+    source, target = adj.node(start), adj.node(goal)
+    goal_y, goal_x = goal
+
+    pq: list[tuple[int, int]] = [(heuristic(start, goal), source)]
+    came = adj.scratch("parent", UNSET)  # Reusable int32 per-node arrays
+    seen = adj.scratch("closed", 0)
+    came[source] = source
 
     while pq:
         if render and not render.running:
             return []
         _, cur = heapq.heappop(pq)
-        if cur in seen:
+        if seen[cur]:
             continue
-        seen.add(cur)
-        if cur == goal:
-            path = _reconstruct(came, cur)
+        seen[cur] = 1
+        if cur == target:
+            path = adj.path(_reconstruct(came, cur))
             maze.add_solution(path, "Greedy BFS")
             if render:
                 for p in path:
                     render.mark_cell(p, color)
                     render.update()
             return path
-        for dy, dx in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-            nb = (cur[0] + dy, cur[1] + dx)
-            if inside(nb) and grid[nb] == 1 and nb not in seen:
+        for k in range(indptr[cur], indptr[cur + 1]):
+            nb = indices[k]
+            if not seen[nb]:
                 came[nb] = cur
-                heapq.heappush(pq, (heuristic(nb, goal), nb))
+                heapq.heappush(pq, (abs(ys[nb] - goal_y) + abs(xs[nb] - goal_x), nb))
         if render:
-            render.mark_cell(cur, (255, 200, 0))
+            render.mark_cell(adj.pos(cur), (255, 200, 0))
             render.update()
     return []
@@ -0,0 +1,293 @@
+# solvers/hpa.py
+"""Hierarchical pathfinding (HPA*) solver for large Maze objects."""
+import heapq
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+from models.maze import Maze
+from models.packed import PackedGrid
+from solvers.wavefront import descend, distance_fields
+
+# Sources flooded per batched distance_fields() call while building tables
+_CHUNK = 2048
+
+_S, _T = -1, -2  # Abstract ids of the query's start and goal
+
+
+class HPA:
+    """Cluster abstraction of a maze grid for hierarchical search.
+
+    The grid is cut into `size` x `size` square clusters. An *entrance* is an
+    open square on a cluster's edge whose neighbour across that edge is open
+    too; entrances are the abstract graph's nodes, keyed by flat grid index
+    (gy * cols + gx). Each cluster keeps a table of the step distances
+    between its entrances through the cluster alone (-1 if they are not
+    connected inside it), and `links` maps each entrance to its partners
+    across cluster edges (distance 1). Every path leaves a cluster through an
+    entrance, so searching this graph gives exact shortest lengths.
+
+    All tables are built in a few batched wavefront floods. After a wall
+    change, update() rebuilds only the cluster holding the square and any
+    neighbour whose entrances moved. Build it with HPA.of(maze) to share one
+    abstraction per maze.
+    """
+
+    def __init__(self, maze: Maze, size: int = 32):
+        if size < 2:
+            raise ValueError("Cluster size must be at least 2 squares")
+        self.maze, self.size = maze, size
+        self.grid = np.asarray(maze.maze)  # Unpacked once for packed grids; a view otherwise
+        self.rows, self.cols = self.grid.shape
+        self.ny, self.nx = -(-self.rows // size), -(-self.cols // size)
+        n = self.ny * self.nx
+        self.members: List[np.ndarray] = [np.zeros(0, dtype=np.int64)] * n
+        self.tables: List[np.ndarray] = [np.zeros((0, 0), dtype=np.int32)] * n
+        self.slot: Dict[int, int] = {}          # Entrance -> its row in its cluster's table
+        self.links: Dict[int, List[int]] = {}   # Entrance -> entrances across cluster edges
+        self.edges: Dict[int, List[Tuple[int, int]]] = {}  # Entrance -> (entrance, distance), both kinds
+        for c in range(n):
+            self._scan(c)
+        self._build_tables(range(n))
+
+    @classmethod
+    def of(cls, maze: Maze, size: int = 32) -> 'HPA':
+        """The maze's cached abstraction for *size* clusters, built on first use."""
+        return maze.cached(cls.key(size), lambda m: cls(m, size))
+
+    @staticmethod
+    def key(size: int) -> str:
+        """Maze cache key of the abstraction for *size* clusters."""
+        return f"hpa:{size}"
+
+    def cluster(self, f: int) -> int:
+        """Cluster holding flat grid index *f*."""
+        y, x = divmod(f, self.cols)
+        return (y // self.size) * self.nx + x // self.size
+
+    def _bounds(self, c: int) -> Tuple[int, int, int, int]:
+        cy, cx = divmod(c, self.nx)
+        y0, x0 = cy * self.size, cx * self.size
+        return y0, x0, min(y0 + self.size, self.rows), min(x0 + self.size, self.cols)
+
+    def _scan(self, c: int):
+        """Recompute the entrances of cluster *c* and their cross-edge links."""
+        grid, cols = self.grid, self.cols
+        y0, x0, y1, x1 = self._bounds(c)
+        for f in self.members[c].tolist():
+            del self.slot[f], self.links[f]
+        found: Dict[int, List[int]] = {}
+        ys, xs = np.arange(y0, y1), np.arange(x0, x1)
+        # (inside squares, outside squares) along each edge that has a neighbour
+        edges = []
+        if x1 < cols:
+            edges.append((ys * cols + x1 - 1, ys * cols + x1))
+        if x0 > 0:
+            edges.append((ys * cols + x0, ys * cols + x0 - 1))
+        if y1 < self.rows:
+            edges.append(((y1 - 1) * cols + xs, y1 * cols + xs))
+        if y0 > 0:
+            edges.append((y0 * cols + xs, (y0 - 1) * cols + xs))
+        flat = grid.reshape(-1)
+        for inside, outside in edges:
+            both = (flat[inside] != 0) & (flat[outside] != 0)
+            for f, g in zip(inside[both].tolist(), outside[both].tolist()):
+                found.setdefault(f, []).append(g)
+        members = np.array(sorted(found), dtype=np.int64)
+        for f in np.setdiff1d(self.members[c], members).tolist():
+            del self.edges[f]
+        self.members[c] = members
+        for i, f in enumerate(members.tolist()):
+            self.slot[f] = i
+            self.links[f] = found[f]
+
+    def _blocks(self, clusters: List[int]) -> np.ndarray:
+        """size x size copies of the given clusters' grid squares, wall-padded at the edges."""
+        out = np.zeros((len(clusters), self.size, self.size), dtype=np.int8)
+        for k, c in enumerate(clusters):
+            y0, x0, y1, x1 = self._bounds(c)
+            out[k, :y1 - y0, :x1 - x0] = self.grid[y0:y1, x0:x1]
+        return out
+
+    def _local(self, c: int, f: int) -> Tuple[int, int]:
+        y0, x0, _, _ = self._bounds(c)
+        y, x = divmod(f, self.cols)
+        return y - y0, x - x0
+
+    def _fields(self, jobs: List[Tuple[int, int]]) -> np.ndarray:
+        """In-cluster distance fields for (cluster, flat source) jobs, batched."""
+        out = np.empty((len(jobs), self.size, self.size), dtype=np.int32)
+        for lo in range(0, len(jobs), _CHUNK):
+            part = jobs[lo:lo + _CHUNK]
+            clusters = sorted({c for c, _ in part})
+            at = {c: k for k, c in enumerate(clusters)}
+            blocks = self._blocks(clusters)
+            out[lo:lo + len(part)] = distance_fields(blocks[[at[c] for c, _ in part]],
+                                                     [self._local(c, f) for c, f in part])
+        return out
+
+    def _build_tables(self, clusters):
+        """Rebuild the entrance tables and edges of *clusters*, flooding _CHUNK sources at a time.
+
+        Each chunk's fields are cut down to table rows straight away, so peak
+        memory stays at one chunk of fields rather than one per entrance.
+        """
+        for c in clusters:
+            m = self.members[c].size
+            self.tables[c] = np.empty((m, m), dtype=np.int32)
+        jobs = [(c, f) for c in clusters for f in self.members[c].tolist()]
+        for lo in range(0, len(jobs), _CHUNK):
+            part = jobs[lo:lo + _CHUNK]
+            fields = self._fields(part)
+            i = 0
+            while i < len(part):  # A cluster's jobs are contiguous, possibly split across chunks
+                c, f = part[i]
+                j = i + 1
+                while j < len(part) and part[j][0] == c:
+                    j += 1
+                ly, lx = np.divmod(self.members[c], self.cols)
+                y0, x0, _, _ = self._bounds(c)
+                row = self.slot[f]
+                self.tables[c][row:row + j - i] = fields[i:j][:, ly - y0, lx - x0]
+                i = j
+        for c in clusters:
+            members = self.members[c].tolist()
+            for f, row in zip(members, self.tables[c].tolist()):
+                self.edges[f] = [(g, d) for g, d in zip(members, row) if d > 0] + [(g, 1) for g in self.links[f]]
+
+    def update(self, pos: Tuple[int, int]):
+        """Refresh the abstraction after the grid square *pos* was opened or walled.
+
+        Only the square's cluster and its up-to-four neighbours are rescanned;
+        tables are rebuilt for its cluster and for neighbours whose entrances
+        or links changed.
+        """
+        c = self.cluster(pos[0] * self.cols + pos[1])
+        cy, cx = divmod(c, self.nx)
+        dirty = [c]
+        for ny, nx in ((cy - 1, cx), (cy + 1, cx), (cy, cx - 1), (cy, cx + 1)):
+            if 0 <= ny < self.ny and 0 <= nx < self.nx:
+                nb = ny * self.nx + nx
+                before = [(f, self.links[f]) for f in self.members[nb].tolist()]
+                self._scan(nb)
+                if before != [(f, self.links[f]) for f in self.members[nb].tolist()]:
+                    dirty.append(nb)
+        self._scan(c)
+        self._build_tables(dirty)
+
+    def set_wall(self, pos: Tuple[int, int], wall: bool):
+        """Wall (or open) grid square *pos*, keeping this abstraction and dropping the maze's other caches."""
+        if isinstance(self.maze.maze, PackedGrid):
+            raise ValueError("Packed grids are read-only; call unpack() before editing walls.")
+        self.maze.maze[pos] = 0 if wall else 1
+        self.maze.invalidate(keep=(self.key(self.size),))
+        self.update(pos)
+
+    def path(self, start: Tuple[int, int], goal: Tuple[int, int]) -> List[Tuple[int, int]]:
+        """Shortest path from *start* to *goal* ([] if none).
+
+        Floods the two end clusters to hook start and goal onto their
+        entrances, runs A* over the entrance graph, then refines only the
+        clusters on the chosen route.
+        """
+        grid, cols = self.grid, self.cols
+        inside = lambda p: 0 <= p[0] < self.rows and 0 <= p[1] < cols
+        if not (inside(start) and inside(goal)) or grid[start] == 0 or grid[goal] == 0:
+            raise ValueError("Start/goal invalid or in wall")
+        if start == goal:
+            return [start]
+        s, t = start[0] * cols + start[1], goal[0] * cols + goal[1]
+        cs, ct = self.cluster(s), self.cluster(t)
+        field_s, field_t = self._fields([(cs, s), (ct, t)])
+        to_s = self._at(field_s, cs, self.members[cs])
+        to_t = self._at(field_t, ct, self.members[ct])
+        direct = int(self._at(field_s, cs, np.array([t]))[0]) if cs == ct else -1
+
+        to_s, to_t = to_s.tolist(), to_t.tolist()
+        goal_slot = {f: i for i, f in enumerate(self.members[ct].tolist()) if to_t[i] >= 0}
+
+        def neighbours(u: int) -> List[Tuple[int, int]]:
+            if u == _S:
+                nbrs = [(f, d) for f, d in zip(self.members[cs].tolist(), to_s) if d >= 0]
+                if direct >= 0:
+                    nbrs.append((_T, direct))
+                return nbrs
+            if u in goal_slot:
+                return self.edges[u] + [(_T, to_t[goal_slot[u]])]
+            return self.edges[u]
+
+        gy, gx = goal
+
+        def h(u: int) -> int:  # Manhattan distance to the goal
+            if u == _T:
+                return 0
+            y, x = start if u == _S else divmod(u, cols)
+            return abs(y - gy) + abs(x - gx)
+
+        g_score = {_S: 0}
+        parent = {_S: _S}
+        heap = [(h(_S), 0, _S)]
+        while heap:
+            _, d, u = heapq.heappop(heap)
+            if d > g_score[u]:
+                continue
+            if u == _T:
+                break
+            for v, w in neighbours(u):
+                nd = d + w
+                if nd < g_score.get(v, nd + 1):
+                    g_score[v] = nd
+                    parent[v] = u
+                    heapq.heappush(heap, (nd + h(v), nd, v))
+        else:
+            return []
+
+        route = [_T]
+        while route[-1] != _S:
+            route.append(parent[route[-1]])
+        route.reverse()
+        return self._refine(route, s, t)
+
+    def _at(self, field: np.ndarray, c: int, flats: np.ndarray) -> np.ndarray:
+        """Values of an in-cluster *field* of cluster *c* at flat grid indices *flats*."""
+        y0, x0, _, _ = self._bounds(c)
+        ys, xs = np.divmod(flats, self.cols)
+        return field[ys - y0, xs - x0]
+
+    def _refine(self, route: List[int], s: int, t: int) -> List[Tuple[int, int]]:
+        """Expand an abstract route into grid squares, flooding only the clusters it crosses."""
+        flats = [s] + route[1:-1] + [t]
+        hops = list(zip(flats, flats[1:]))
+        jobs = [(self.cluster(a), a) for a, b in hops if self.cluster(a) == self.cluster(b)]
+        fields = iter(self._fields(jobs))
+        path = [divmod(s, self.cols)]
+        for a, b in hops:
+            c = self.cluster(a)
+            if c != self.cluster(b):  # A step across a cluster edge
+                path.append(divmod(b, self.cols))
+                continue
+            y0, x0, _, _ = self._bounds(c)
+            local = descend(next(fields), self._local(c, b))
+            path += [(y + y0, x + x0) for y, x in local[1:]]
+        return path
+
+
+def solve(maze: Maze,
+          start: Tuple[int, int],
+          goal: Tuple[int, int],
+          render=None,
+          color: Optional[Tuple[int, int, int]] = (0, 255, 0),
+          size: int = 32
+          ) -> List[Tuple[int, int]]:
+    """HPA* pathfinder.
+
+    Searches the maze's cached cluster abstraction (see HPA) and refines
+    only the clusters on the chosen route. Returns a shortest path or an
+    empty list if none exists.
+    """
+    path = HPA.of(maze, size).path(start, goal)
+    if path:
+        maze.add_solution(path, "HPA*")
+        if render:
+            for pos in path:
+                render.mark_cell(pos, color)
+                render.update()
+    return path
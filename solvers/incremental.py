@@ -0,0 +1,179 @@
+# solvers/incremental.py
+"""Incremental (LPA*) solver for Maze objects whose walls change."""
+import heapq
+import numpy as np
+from typing import List, Optional, Tuple
+from models.adjacency import INF
+from models.maze import Maze
+from models.packed import PackedGrid
+
+
+class IncrementalSolver:
+    """Lifelong Planning A* between a fixed start and goal on a maze being edited.
+
+    The first path() runs an A*-like search over the grid squares. After
+    that, set_wall() (or update() after editing `maze.maze` yourself) only
+    marks the touched squares inconsistent, and the next path() repairs the
+    previous search: work is proportional to the squares whose distance
+    actually changed, not to the maze. Edits between two path() calls are
+    repaired together.
+
+    Per-square state lives in int32 arrays over the flat grid (gy * cols +
+    gx): `g` is the settled distance from the start and `rhs` the one-step
+    lookahead; squares where they differ wait in a heap keyed by
+    (min(g, rhs) + Manhattan distance to goal, min(g, rhs)). `expanded`
+    counts the squares processed so far.
+
+    The solver is bound to one generation of the grid it was created on:
+    after the maze is regenerated (or its grid replaced) path() raises, so
+    create a new solver. Grid edits made without set_wall()/update() are
+    not tracked and may make path() raise too.
+    """
+
+    def __init__(self, maze: Maze, start: Tuple[int, int], goal: Tuple[int, int]):
+        grid = np.asarray(maze.maze)  # Packed grids are unpacked once and solved read-only
+        rows, cols = grid.shape
+        inside = lambda p: 0 <= p[0] < rows and 0 <= p[1] < cols
+        if not (inside(start) and inside(goal)) or grid[start] == 0 or grid[goal] == 0:
+            raise ValueError("Start/goal invalid or in wall")
+        if not grid.flags.c_contiguous:
+            raise ValueError("IncrementalSolver needs a C-contiguous grid")
+        self.maze, self.start, self.goal = maze, start, goal
+        self.rows, self.cols = rows, cols
+        self._grid, self._generation = maze.maze, maze.generation
+        self._open = memoryview(grid.reshape(-1))
+        n = rows * cols
+        self.g = np.full(n, INF, dtype=np.int32)
+        self.rhs = np.full(n, INF, dtype=np.int32)
+        self._g, self._rhs = memoryview(self.g), memoryview(self.rhs)
+        # Key each queued square was last pushed with (-1: not queued); older heap entries are stale
+        self._k1 = memoryview(np.full(n, -1, dtype=np.int32))
+        self._k2 = memoryview(np.full(n, -1, dtype=np.int32))
+        self._heap: List[Tuple[int, int, int]] = []
+        self._s = start[0] * cols + start[1]
+        self._t = goal[0] * cols + goal[1]
+        self.expanded = 0
+        self._rhs[self._s] = 0
+        self._push(self._s)
+
+    def _neighbours(self, u: int) -> List[int]:
+        cols = self.cols
+        y, x = divmod(u, cols)
+        out = []
+        if x + 1 < cols:
+            out.append(u + 1)
+        if x > 0:
+            out.append(u - 1)
+        if y + 1 < self.rows:
+            out.append(u + cols)
+        if y > 0:
+            out.append(u - cols)
+        return out
+
+    def _push(self, u: int):
+        y, x = divmod(u, self.cols)
+        k2 = min(self._g[u], self._rhs[u])
+        k1 = k2 + abs(y - self.goal[0]) + abs(x - self.goal[1])
+        self._k1[u], self._k2[u] = k1, k2
+        heapq.heappush(self._heap, (k1, k2, u))
+
+    def _update(self, u: int):
+        """Recompute rhs of square *u* from its neighbours and (de)queue it."""
+        g, rhs, open_ = self._g, self._rhs, self._open
+        if u == self._s:
+            rhs[u] = 0 if open_[u] else INF
+        elif not open_[u]:
+            rhs[u] = INF
+        else:
+            best = INF
+            for v in self._neighbours(u):
+                if open_[v] and g[v] + 1 < best:
+                    best = g[v] + 1
+            rhs[u] = best
+        if g[u] != rhs[u]:
+            self._push(u)
+        else:
+            self._k1[u] = -1
+
+    def _repair(self):
+        heap, g, rhs, k1s, k2s = self._heap, self._g, self._rhs, self._k1, self._k2
+        t = self._t
+        while heap:
+            k1, k2, u = heap[0]
+            if k1s[u] != k1 or k2s[u] != k2:  # Superseded or dequeued
+                heapq.heappop(heap)
+                continue
+            goal_k2 = min(g[t], rhs[t])
+            if g[t] == rhs[t] and (k1, k2) >= (goal_k2, goal_k2):
+                break  # Goal consistent and nothing cheaper left to settle
+            heapq.heappop(heap)
+            k1s[u] = -1
+            self.expanded += 1
+            if g[u] > rhs[u]:
+                g[u] = rhs[u]
+            else:
+                g[u] = INF
+                self._update(u)
+            for v in self._neighbours(u):
+                self._update(v)
+
+    def _check(self):
+        if self.maze.maze is not self._grid or self.maze.generation != self._generation:
+            raise ValueError("Maze was regenerated or its grid replaced; create a new IncrementalSolver")
+
+    def update(self, pos: Tuple[int, int]):
+        """Account for grid square *pos* having been opened or walled in `maze.maze`."""
+        self._check()
+        u = pos[0] * self.cols + pos[1]
+        self._update(u)
+        for v in self._neighbours(u):
+            self._update(v)
+
+    def set_wall(self, pos: Tuple[int, int], wall: bool):
+        """Wall (or open) grid square *pos*; the maze's cached structures are dropped."""
+        self._check()
+        if isinstance(self.maze.maze, PackedGrid):
+            raise ValueError("Packed grids are read-only; call unpack() before editing walls.")
+        self.maze.maze[pos] = 0 if wall else 1
+        self.maze.invalidate()
+        self.update(pos)
+
+    def path(self) -> List[Tuple[int, int]]:
+        """Shortest path from start to goal on the current grid ([] if none)."""
+        self._check()
+        self._repair()
+        g, open_, cur = self._g, self._open, self._t
+        if g[cur] >= INF:
+            return []
+        nodes = [cur]
+        while cur != self._s:
+            # Step to a neighbour one closer to the start
+            closer = [v for v in self._neighbours(cur) if open_[v] and g[v] == g[cur] - 1]
+            if not closer:
+                raise ValueError("Grid changed without update(); create a new IncrementalSolver")
+            cur = closer[0]
+            nodes.append(cur)
+        nodes.reverse()
+        return [divmod(u, self.cols) for u in nodes]
+
+
+def solve(maze: Maze,
+          start: Tuple[int, int],
+          goal: Tuple[int, int],
+          render=None,
+          color: Optional[Tuple[int, int, int]] = (0, 255, 0)
+          ) -> List[Tuple[int, int]]:
+    """LPA* pathfinder.
+
+    One-shot use of IncrementalSolver; keep an IncrementalSolver instead to
+    re-solve cheaply while editing walls. Returns a shortest path or an
+    empty list if none exists.
+    """
+    path = IncrementalSolver(maze, start, goal).path()
+    if path:
+        maze.add_solution(path, "LPA*")
+        if render:
+            for pos in path:
+                render.mark_cell(pos, color)
+                render.update()
+    return path
@@ -0,0 +1,80 @@
+# solvers/landmarks.py
+"""Landmark (ALT) distance tables: triangle-inequality heuristics for A*."""
+import numpy as np
+from models.adjacency import INF
+from models.maze import Maze
+from solvers.wavefront import distance_field
+
+
+class Landmarks:
+    """Step distances from a few landmark squares to every junction of a maze.
+
+    For any landmark L, |d(L, v) - d(L, goal)| <= d(v, goal) by the triangle
+    inequality, so the maximum over the landmarks is a consistent A*
+    heuristic. Landmarks far out on the maze's periphery bound best, so they
+    are picked farthest-first: each new one is the junction or dead end
+    farthest from all landmarks so far (one per component before any
+    component gets a second).
+
+    `table[i]` holds the distances from landmark i to each key of
+    `maze.junctions()` (-1 where unreachable); corridor squares are bounded
+    through their corridor's ends. Build it with Landmarks.of(maze, count)
+    to share the tables across queries on one maze.
+    """
+
+    def __init__(self, maze: Maze, count: int):
+        if count < 1:
+            raise ValueError("count must be at least 1")
+        jg = maze.junctions()
+        k = jg.k
+        cols = maze.maze.shape[1]
+        flat = jg.ys[:k].astype(np.int64) * cols + jg.xs[:k]
+        count = min(count, k)
+
+        self.jg = jg
+        self.table = np.empty((count, k), dtype=np.int32)
+        nearest = np.full(k, INF, dtype=np.int64)  # Distance to the closest landmark so far
+        pick = int(np.argmax(distance_field(maze, jg.pos(0)).reshape(-1)[flat]))
+        for i in range(count):
+            row = distance_field(maze, jg.pos(pick)).reshape(-1)[flat]
+            self.table[i] = row
+            nearest = np.where((row >= 0) & (row < nearest), row, nearest)
+            pick = int(np.argmax(nearest))
+
+    @classmethod
+    def of(cls, maze: Maze, count: int) -> 'Landmarks':
+        """The maze's cached tables for *count* landmarks, built on first use."""
+        return maze.cached(f"landmarks:{count}", lambda m: cls(m, count))
+
+    def distances(self, node: int) -> np.ndarray:
+        """Distances from each landmark to adjacency node *node* (-1 if unreachable)."""
+        jg = self.jg
+        key = int(jg.key_of[node])
+        if key >= 0:
+            return self.table[:, key]
+        # A corridor square is reached through one of its corridor's ends
+        e, i = int(jg.via[node]), int(jg.at[node])
+        u, v, w = jg.sources_mv[e], jg.indices_mv[e], jg.weights_mv[e]
+        du, dv = self.table[:, u].astype(np.int64), self.table[:, v].astype(np.int64)
+        via_u = np.where(du >= 0, du + i + 1, INF)
+        via_v = np.where(dv >= 0, dv + w - i - 1, INF)
+        best = np.minimum(via_u, via_v)
+        return np.where(best < INF, best, -1).astype(np.int32)
+
+    def bounds(self, target: int) -> np.ndarray:
+        """Lower bounds on the step distance to adjacency node *target*, per junction id.
+
+        Indexed like the ids of `maze.junctions()` after attach(), including
+        the attached endpoints in slots k and k + 1.
+        """
+        jg = self.jg
+        k = jg.k
+        to = self.distances(target)[:, None]
+        cols = [self.table, self.distances(jg.nodes[k])[:, None], self.distances(jg.nodes[k + 1])[:, None]]
+        out = np.zeros(k + 2, dtype=np.int32)
+        start = 0
+        for d in cols:
+            gap = np.where((d >= 0) & (to >= 0), np.abs(d - to), 0)
+            out[start:start + d.shape[1]] = gap.max(axis=0)
+            start += d.shape[1]
+        return out
@@ -0,0 +1,132 @@
+# solvers/tree_lca.py
+"""Tree-index solver for perfect mazes: O(log n) distance and O(path) path queries."""
+import numpy as np
+from typing import Tuple, List, Optional
+from models.maze import Maze
+from solvers.wavefront import distance_field
+
+
+class TreeIndex:
+    """A perfect maze's open squares as a rooted tree with jump pointers.
+
+    In a perfect maze the open squares form a spanning tree, so the path
+    between two squares is the unique tree path through their lowest common
+    ancestor (LCA). The tree is rooted at the first open square and every
+    node gets `parent`, `depth` and a skew-binary `jump` pointer (Myers'
+    scheme), which reaches any ancestor, and so the LCA, in O(log n) hops
+    while storing O(n) rather than O(n log n) like binary lifting tables.
+
+    Nodes are those of `maze.adjacency()`. Build it with TreeIndex.of(maze)
+    to share one index per maze; it raises ValueError if the open squares
+    are not a single tree (braided or disconnected grids).
+    """
+
+    def __init__(self, maze: Maze):
+        adj = maze.adjacency()
+        n = adj.n
+        if n == 0:
+            raise ValueError("Maze has no open squares")
+        if adj.indices.size != 2 * (n - 1):
+            raise ValueError("Maze is not perfect: its open squares do not form a tree")
+        field = distance_field(maze, adj.pos(0)).ravel()
+        depth = field[adj.ys.astype(np.int64) * adj.cols + adj.xs]
+        if (depth < 0).any():
+            raise ValueError("Maze is not perfect: its open squares are disconnected")
+
+        # Each non-root node's parent is its unique neighbour one step shallower
+        owner = np.repeat(np.arange(n, dtype=np.int32), np.diff(adj.indptr))
+        up = depth[adj.indices] == depth[owner] - 1
+        parent = np.zeros(n, dtype=np.int32)
+        parent[owner[up]] = adj.indices[up]
+
+        # jump[v] depends on the parent's pointers, so fill them in depth order
+        jump = np.zeros(n, dtype=np.int32)
+        p_mv, j_mv, d_mv = memoryview(parent), memoryview(jump), memoryview(depth)
+        for v in np.argsort(depth, kind="stable")[1:].tolist():
+            p = p_mv[v]
+            jp = j_mv[p]
+            if d_mv[p] - d_mv[jp] == d_mv[jp] - d_mv[j_mv[jp]]:
+                j_mv[v] = j_mv[jp]
+            else:
+                j_mv[v] = p
+
+        self.adj = adj
+        self.parent, self.depth, self.jump = parent, depth, jump
+        self._parent, self._depth, self._jump = p_mv, d_mv, j_mv
+
+    @classmethod
+    def of(cls, maze: Maze) -> 'TreeIndex':
+        """The maze's cached index, built on first use."""
+        return maze.cached("tree_index", cls)
+
+    def ancestor(self, v: int, d: int) -> int:
+        """Ancestor of node *v* at depth *d* (<= depth of *v*), in O(log n)."""
+        depth, jump, parent = self._depth, self._jump, self._parent
+        while depth[v] > d:
+            j = jump[v]
+            v = j if depth[j] >= d else parent[v]
+        return v
+
+    def lca(self, a: int, b: int) -> int:
+        """Lowest common ancestor of nodes *a* and *b*, in O(log n)."""
+        depth, jump, parent = self._depth, self._jump, self._parent
+        if depth[a] > depth[b]:
+            a = self.ancestor(a, depth[b])
+        elif depth[b] > depth[a]:
+            b = self.ancestor(b, depth[a])
+        # Equal depths give equal jump depths, so a and b climb in step
+        while a != b:
+            if jump[a] != jump[b]:
+                a, b = jump[a], jump[b]
+            else:
+                a, b = parent[a], parent[b]
+        return a
+
+    def distance(self, start: Tuple[int, int], goal: Tuple[int, int]) -> int:
+        """Number of steps on the path between two open squares, in O(log n)."""
+        a, b = self._nodes(start, goal)
+        depth = self._depth
+        return depth[a] + depth[b] - 2 * depth[self.lca(a, b)]
+
+    def path(self, start: Tuple[int, int], goal: Tuple[int, int]) -> List[Tuple[int, int]]:
+        """The path from *start* to *goal*, in O(log n + path length)."""
+        a, b = self._nodes(start, goal)
+        top = self.lca(a, b)
+        parent = self._parent
+        head, tail = [a], [b]
+        while head[-1] != top:
+            head.append(parent[head[-1]])
+        while tail[-1] != top:
+            tail.append(parent[tail[-1]])
+        return self.adj.path(head + tail[-2::-1])
+
+    def _nodes(self, start: Tuple[int, int], goal: Tuple[int, int]) -> Tuple[int, int]:
+        adj = self.adj
+        inside = lambda p: 0 <= p[0] < adj.rows and 0 <= p[1] < adj.cols
+        if not (inside(start) and inside(goal)):
+            raise ValueError("Start/goal invalid or in wall")
+        a, b = adj.node(start), adj.node(goal)
+        if a < 0 or b < 0:
+            raise ValueError("Start/goal invalid or in wall")
+        return a, b
+
+
+def solve(maze: Maze,
+          start: Tuple[int, int],
+          goal: Tuple[int, int],
+          render=None,
+          color: Optional[Tuple[int, int, int]] = (0, 255, 0)
+          ) -> List[Tuple[int, int]]:
+    """Tree-path solver for perfect mazes.
+
+    Answers from the maze's cached TreeIndex, so after the first query on a
+    maze each solve costs O(log n + path length) with no search at all.
+    Raises ValueError if the maze is not perfect.
+    """
+    path = TreeIndex.of(maze).path(start, goal)
+    maze.add_solution(path, "Tree LCA")
+    if render:
+        for pos in path:
+            render.mark_cell(pos, color)
+            render.update()
+    return path
@@ -0,0 +1,260 @@
+# solvers/wavefront.py
+"""Vectorized wavefront BFS: distance fields and gradient-descent paths for Maze objects."""
+import numpy as np
+from typing import Tuple, List, Optional, Sequence
+from models.maze import Maze
+
+# Waves up to this many squares are expanded with scalar loops instead of NumPy
+_NARROW = 64
+
+
+def _flood(open_: np.ndarray, dist: np.ndarray, frontier: list, goals, block: int, pc: int):
+    """Expand BFS waves over flattened, closed-border padded grid(s) in place.
+
+    *open_* holds one or more padded grids of *block* squares each, laid end
+    to end; *pc* is the padded row length. The closed border keeps the shifts
+    +-1 and +-pc inside each grid, so every grid floods independently in the
+    same waves. *frontier* lists the sources, already set to 0 in *dist*.
+    A grid stops expanding once its square in *goals* (one per grid at most)
+    is reached.
+    """
+    offsets = (1, -1, pc, -pc)
+    offsets_arr = np.array(offsets)
+    slot = np.empty(open_.size, dtype=np.int32)   # Scratch for de-duplicating a wave
+    is_goal = np.zeros(open_.size, dtype=np.uint8)
+    is_goal[np.asarray(goals, dtype=np.int64)] = 1
+    done = np.zeros(open_.size // block, dtype=np.uint8)
+    open_mv, dist_mv = memoryview(open_), memoryview(dist)
+    goal_mv, done_mv = memoryview(is_goal), memoryview(done)
+    for v in frontier:
+        if goal_mv[v]:
+            done_mv[v // block] = 1
+    frontier = [v for v in frontier if not done_mv[v // block]]
+
+    level = 0
+    while len(frontier):
+        level += 1
+        if len(frontier) <= _NARROW:
+            # Corridor-sized wave: plain loops beat a dozen small-array NumPy calls
+            wave, hit = [], False
+            for v in frontier:
+                for off in offsets:
+                    u = v + off
+                    if open_mv[u] and dist_mv[u] < 0:
+                        dist_mv[u] = level
+                        wave.append(u)
+                        if goal_mv[u]:
+                            done_mv[u // block] = 1
+                            hit = True
+            frontier = [u for u in wave if not done_mv[u // block]] if hit else wave
+            continue
+        cand = (np.asarray(frontier)[:, None] + offsets_arr).ravel()
+        cand = cand[(open_[cand] != 0) & (dist[cand] < 0)]
+        # Keep one copy of each square: the last write to slot[] wins
+        slot[cand] = np.arange(cand.size, dtype=np.int32)
+        cand = cand[slot[cand] == np.arange(cand.size)]
+        dist[cand] = level
+        reached = cand[is_goal[cand] != 0]
+        if reached.size:
+            done[reached // block] = 1
+            cand = cand[done[cand // block] == 0]
+        frontier = cand if cand.size > _NARROW else cand.tolist()
+
+
+def distance_field(maze: Maze, source: Tuple[int, int],
+                   target: Optional[Tuple[int, int]] = None) -> np.ndarray:
+    """BFS distance (in grid steps) from *source* to every open square.
+
+    The whole frontier is expanded per iteration with NumPy: the grid is
+    padded with a closed border and flattened, so the four neighbour shifts
+    are the offsets +-1 and +-cols and never wrap. Each wave costs O(frontier)
+    array work rather than O(grid); narrow waves (long corridors, where a
+    perfect maze spends most of its depth) fall back to scalar loops.
+
+    Returns an int32 array shaped like `maze.maze`, -1 for walls and
+    unreachable squares. With *target* the search stops once it is reached,
+    so farther squares stay -1.
+    """
+    grid = np.asarray(maze.maze)
+    rows, cols = grid.shape
+    sy, sx = source
+    if not (0 <= sy < rows and 0 <= sx < cols) or grid[sy, sx] == 0:
+        raise ValueError(f"Source {source} is out of bounds or a wall")
+    pc = cols + 2
+    open_ = np.zeros((rows + 2, pc), dtype=np.uint8)
+    open_[1:-1, 1:-1] = grid != 0
+    open_ = open_.ravel()
+    dist = np.full(open_.size, -1, dtype=np.int32)
+    source_i = (sy + 1) * pc + sx + 1
+    dist[source_i] = 0
+    goals = [] if target is None else [(target[0] + 1) * pc + target[1] + 1]
+    _flood(open_, dist, [source_i], goals, open_.size, pc)
+    return dist.reshape(rows + 2, pc)[1:-1, 1:-1]
+
+
+def descend(dist: np.ndarray, goal: Tuple[int, int]) -> List[Tuple[int, int]]:
+    """Extract a shortest path to *goal* by gradient descent on a distance field.
+
+    From *goal*, repeatedly step to a neighbour one closer to the source
+    (distance 0). Returns the path source-first, or [] if *goal* is
+    unreachable in *dist*.
+    """
+    rows, cols = dist.shape
+    y, x = goal
+    d = int(dist[y, x])
+    if d < 0:
+        return []
+    flat = memoryview(np.ascontiguousarray(dist).reshape(-1))
+    path = [(y, x)]
+    while d:
+        d -= 1
+        i = y * cols + x
+        if x + 1 < cols and flat[i + 1] == d:
+            x += 1
+        elif x > 0 and flat[i - 1] == d:
+            x -= 1
+        elif y + 1 < rows and flat[i + cols] == d:
+            y += 1
+        else:
+            y -= 1
+        path.append((y, x))
+    path.reverse()
+    return path
+
+
+def solve(maze: Maze,
+          start: Tuple[int, int],
+          goal: Tuple[int, int],
+          render=None,
+          color: Optional[Tuple[int, int, int]] = (0, 255, 0)
+          ) -> List[Tuple[int, int]]:
+    """Wavefront BFS pathfinder.
+
+    Floods a distance field from *start* until *goal* is reached, then
+    walks it back down. Returns a shortest path or an empty list if none
+    exists. For many targets from one source, call distance_field() once
+    and descend() per target instead.
+    """
+    grid = maze.maze
+    h, w = grid.shape
+    inside = lambda p: 0 <= p[0] < h and 0 <= p[1] < w
+    if not (inside(start) and inside(goal)) or grid[start] == 0 or grid[goal] == 0:
+        raise ValueError("Start/goal invalid or in wall")
+
+    path = descend(distance_field(maze, start, target=goal), goal)
+    if path:
+        maze.add_solution(path, "Wavefront BFS")
+        if render:
+            for pos in path:
+                render.mark_cell(pos, color)
+                render.update()
+    return path
+
+
+def _pad_stack(stack: np.ndarray) -> Tuple[np.ndarray, int, int]:
+    """Flatten an (N, rows, cols) grid stack into closed-border padded blocks.
+
+    Returns (open_, block, pc): the uint8 open mask, the squares per padded
+    grid, and the padded row length.
+    """
+    n, rows, cols = stack.shape
+    pc = cols + 2
+    open_ = np.zeros((n, rows + 2, pc), dtype=np.uint8)
+    open_[:, 1:-1, 1:-1] = stack != 0
+    return open_.ravel(), (rows + 2) * pc, pc
+
+
+def _flat_points(open_: np.ndarray, points, what: str, shape: Tuple[int, int, int]) -> np.ndarray:
+    """Flat padded indices of one (gy, gx) per grid; ValueError if any is outside or a wall."""
+    n, rows, cols = shape
+    pc = cols + 2
+    pts = np.asarray(points, dtype=np.int64).reshape(n, 2)
+    ys, xs = pts[:, 0], pts[:, 1]
+    idx = np.arange(n) * (rows + 2) * pc + (ys + 1) * pc + xs + 1
+    bad = (ys < 0) | (ys >= rows) | (xs < 0) | (xs >= cols)
+    bad[~bad] = open_[idx[~bad]] == 0
+    if bad.any():
+        i = int(np.flatnonzero(bad)[0])
+        raise ValueError(f"{what} {tuple(pts[i])} of grid {i} is out of bounds or a wall")
+    return idx
+
+
+def distance_fields(grids, sources: Sequence[Tuple[int, int]]) -> np.ndarray:
+    """distance_field() for a stack of same-shaped grids, one source each, in one flood.
+
+    Returns an int32 (N, rows, cols) array, -1 for walls and unreachable
+    squares. Grids may repeat, e.g. one local region flooded from several
+    sources.
+    """
+    stack = np.asarray(grids)
+    if stack.ndim != 3:
+        raise ValueError("grids must be a stack of equal-shaped 2D grids")
+    n, rows, cols = stack.shape
+    if len(sources) != n:
+        raise ValueError(f"Need one source per grid ({n}), got {len(sources)}")
+    open_, block, pc = _pad_stack(stack)
+    source_i = _flat_points(open_, sources, "Source", stack.shape)
+    dist = np.full(open_.size, -1, dtype=np.int32)
+    dist[source_i] = 0
+    _flood(open_, dist, source_i.tolist(), [], block, pc)
+    return dist.reshape(n, rows + 2, pc)[:, 1:-1, 1:-1]
+
+
+def solve_batch(grids, starts: Sequence[Tuple[int, int]], goals: Sequence[Tuple[int, int]],
+                with_paths: bool = True) -> Tuple[np.ndarray, Optional[List[List[Tuple[int, int]]]]]:
+    """Solve a stack of same-shaped mazes at once with one shared wavefront.
+
+    *grids* is an (N, rows, cols) array or a sequence of N equal-shaped grids,
+    with one start and goal per grid. The padded grids are laid end to end
+    and flooded together, so every NumPy call advances all N wavefronts (a
+    maze drops out once its goal is reached), and the paths are then walked
+    back in lockstep. This amortizes the per-wave interpreter overhead that
+    dominates solving many small mazes one by one.
+
+    Returns (lengths, paths): lengths[i] == len(paths[i]), the number of
+    squares on a shortest path of maze i (0 if there is none), and paths[i]
+    as solve() would return it. With with_paths=False only the lengths are
+    computed and paths is None.
+    """
+    stack = np.asarray(grids)
+    if stack.ndim != 3:
+        raise ValueError("grids must be a stack of equal-shaped 2D grids")
+    n, rows, cols = stack.shape
+    if len(starts) != n or len(goals) != n:
+        raise ValueError(f"Need one start and goal per grid ({n}), got {len(starts)} and {len(goals)}")
+    open_, block, pc = _pad_stack(stack)
+    source_i = _flat_points(open_, starts, "Start", stack.shape)
+    goal_i = _flat_points(open_, goals, "Goal", stack.shape)
+    dist = np.full(open_.size, -1, dtype=np.int32)
+    dist[source_i] = 0
+    _flood(open_, dist, source_i.tolist(), goal_i, block, pc)
+
+    steps = dist[goal_i]
+    lengths = np.where(steps >= 0, steps + 1, 0).astype(np.int32)
+    if not with_paths:
+        return lengths, None
+
+    # Descend every reachable goal at once: each walker steps to the first
+    # neighbour (E, W, S, N) one closer to its source and records itself at
+    # its distance, so the rows of `walk` come out source-first.
+    live = np.flatnonzero(steps >= 0)
+    cur, d = goal_i[live], steps[live].astype(np.int64)
+    walk = np.empty((live.size, int(d.max(initial=-1)) + 1), dtype=np.int64)
+    rows_ = np.arange(live.size)
+    walk[rows_, d] = cur
+    offsets = np.array((1, -1, pc, -pc))
+    for _ in range(walk.shape[1] - 1):
+        nbrs = cur[:, None] + offsets
+        down = dist[nbrs] == (d - 1)[:, None]
+        moving = d > 0
+        cur = np.where(moving, nbrs[rows_, down.argmax(axis=1)], cur)
+        d -= moving
+        walk[rows_, d] = cur
+
+    local = walk % block
+    ys, xs = local // pc - 1, local % pc - 1
+    paths: List[List[Tuple[int, int]]] = [[] for _ in range(n)]
+    for k, i in enumerate(live.tolist()):
+        size = int(lengths[i])
+        paths[i] = list(zip(ys[k, :size].tolist(), xs[k, :size].tolist()))
+    return lengths, paths
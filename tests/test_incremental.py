@@ -0,0 +1,29 @@
+# tests/test_incremental.py
+"""IncrementalSolver repairs against BFS, and its guard against regenerated mazes."""
+import numpy as np
+import pytest
+from models.maze import Maze
+from solvers import bfs
+from solvers.incremental import IncrementalSolver
+
+
+def test_repairs_match_bfs():
+    rng = np.random.default_rng(0)
+    m = Maze(15, 15, seed=1).generate("kruskals")
+    solver = IncrementalSolver(m, m.start, m.goal)
+    for _ in range(30):
+        pos = (int(rng.integers(1, 30)), int(rng.integers(1, 30)))
+        if pos not in (m.start, m.goal):
+            solver.set_wall(pos, wall=bool(m.maze[pos]))
+        expected = bfs.solve(m, m.start, m.goal)
+        assert len(solver.path()) == len(expected)
+
+
+def test_regenerated_maze_raises():
+    m = Maze(15, 15, seed=1).generate("dfs")
+    solver = IncrementalSolver(m, m.start, m.goal)
+    solver.path()
+    m.seed = 2
+    m.generate("kruskals")
+    with pytest.raises(ValueError):
+        solver.path()
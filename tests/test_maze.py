@@ -0,0 +1,11 @@
+# tests/test_maze.py
+"""Maze generation: regenerating in place matches a fresh maze with the same seed."""
+import numpy as np
+import pytest
+from models.maze import GENERATORS, Maze
+
+
+@pytest.mark.parametrize("algorithm", sorted(GENERATORS))
+def test_regenerate_matches_fresh(algorithm):
+    m = Maze(20, 20, seed=3).generate("kruskals").generate(algorithm)
+    assert np.array_equal(m.maze, Maze(20, 20, seed=3).generate(algorithm).maze)
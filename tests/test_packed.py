@@ -0,0 +1,31 @@
+# tests/test_packed.py
+"""Solvers on PackedGrid-backed mazes."""
+import pytest
+from models.maze import Maze
+from solvers import bfs, hpa
+from solvers.incremental import IncrementalSolver
+
+
+@pytest.fixture
+def packed():
+    m = Maze(40, 40, seed=4).generate("kruskals")
+    return m, Maze.from_grid(m.pack())
+
+
+def test_hpa_matches_bfs(packed):
+    plain, m = packed
+    assert len(hpa.solve(m, m.start, m.goal, size=8)) == len(bfs.solve(plain, plain.start, plain.goal))
+
+
+def test_hpa_set_wall_rejects_packed(packed):
+    _, m = packed
+    with pytest.raises(ValueError):
+        hpa.HPA.of(m, 8).set_wall((1, 2), wall=True)
+
+
+def test_incremental_matches_bfs(packed):
+    plain, m = packed
+    solver = IncrementalSolver(m, m.start, m.goal)
+    assert len(solver.path()) == len(bfs.solve(plain, plain.start, plain.goal))
+    with pytest.raises(ValueError):
+        solver.set_wall((1, 2), wall=True)
@@ -0,0 +1,83 @@
+# tests/test_weighted.py
+"""Weighted Dijkstra and A* against a plain heap Dijkstra over grid squares."""
+import heapq
+import numpy as np
+import pytest
+from models.maze import Maze
+from solvers import a_star, dijkstra
+
+
+def reference_cost(grid: np.ndarray, start, goal, weights: np.ndarray) -> int:
+    """Cheapest cost from *start* to *goal*, paying weights[v] on entering v."""
+    rows, cols = grid.shape
+    best = {start: 0}
+    heap = [(0, start)]
+    while heap:
+        d, (y, x) = heapq.heappop(heap)
+        if (y, x) == goal:
+            return d
+        if d > best[(y, x)]:
+            continue
+        for v in ((y + 1, x), (y - 1, x), (y, x + 1), (y, x - 1)):
+            if 0 <= v[0] < rows and 0 <= v[1] < cols and grid[v]:
+                nd = d + int(weights[v])
+                if nd < best.get(v, nd + 1):
+                    best[v] = nd
+                    heapq.heappush(heap, (nd, v))
+    return -1
+
+
+def path_cost(path, weights: np.ndarray) -> int:
+    return sum(int(weights[p]) for p in path[1:])
+
+
+def is_walk(grid: np.ndarray, path) -> bool:
+    steps = zip(path, path[1:])
+    return len(set(path)) == len(path) and all(grid[p] for p in path) and \
+        all(abs(a[0] - b[0]) + abs(a[1] - b[1]) == 1 for a, b in steps)
+
+
+def corridor_squares(grid: np.ndarray):
+    """Open squares with exactly two open neighbours."""
+    open_ = np.pad(grid != 0, 1)
+    deg = (open_[:-2, 1:-1].astype(int) + open_[2:, 1:-1] + open_[1:-1, :-2] + open_[1:-1, 2:])
+    return list(zip(*np.nonzero((grid != 0) & (deg == 2))))
+
+
+@pytest.mark.parametrize("solver", [dijkstra, a_star])
+def test_goal_inside_corridor_next_to_start(solver):
+    m = Maze(20, 20, seed=3).generate("dfs")
+    grid = m.maze
+    s = corridor_squares(grid)[0]
+    t = next(v for v in ((s[0] + 1, s[1]), (s[0] - 1, s[1]), (s[0], s[1] + 1), (s[0], s[1] - 1))
+             if grid[v])
+    weights = np.ones(grid.shape, dtype=np.int32)
+    weights[t] = 100
+    path = solver.solve(m, tuple(map(int, s)), tuple(map(int, t)), weights=weights)
+    assert path == [tuple(map(int, s)), tuple(map(int, t))]
+
+
+def test_ring_corridor():
+    grid = np.zeros((5, 11), dtype=np.int8)
+    grid[1, 1:10] = grid[3, 1:10] = grid[1:4, 1] = grid[1:4, 9] = 1
+    m = Maze.from_grid(grid, (1, 3), (1, 4))
+    weights = np.ones(grid.shape, dtype=np.int32)
+    for solver in (dijkstra, a_star):
+        assert solver.solve(m, (1, 3), (1, 4), weights=weights) == [(1, 3), (1, 4)]
+
+
+@pytest.mark.parametrize("solver", [dijkstra, a_star])
+@pytest.mark.parametrize("seed", range(20))
+def test_random_weights_match_reference(solver, seed):
+    rng = np.random.default_rng(seed)
+    m = Maze(12, 12, seed=seed).generate("kruskals")
+    grid = m.maze
+    grid[rng.integers(1, grid.shape[0] - 1, 20), rng.integers(1, grid.shape[1] - 1, 20)] = 1  # Braid
+    m.invalidate()
+    squares = corridor_squares(grid)
+    weights = rng.integers(1, 10, grid.shape).astype(np.int32)
+    for _ in range(5):
+        s, t = (tuple(map(int, squares[i])) for i in rng.choice(len(squares), 2, replace=False))
+        path = solver.solve(m, s, t, weights=weights)
+        assert path[0] == s and path[-1] == t and is_walk(grid, path)
+        assert path_cost(path, weights) == reference_cost(grid, s, t, weights)
@@ -34,12 +34,12 @@ class PygameRenderer:
         if maze:
             print(f"Maze set → shape {maze.maze.shape}")
 
-    def draw_step(self, step: Tuple[Tuple[int, int], Tuple[int, int]]):
+    def draw_step(self, step: Tuple[int, int, int, int]):
         """Replay one carving step — draw white for path (1) and black for wall (0)."""
         if not (self.running and self.maze):
             return
 
-        (gy, gx), (wy, wx) = step            # grid-space coords
+        gy, gx, wy, wx = step                # grid-space coords, one history row
 
         # -- first point --
         color = (255, 255, 255) if self.maze.maze[gy, gx] else (0, 0, 0)